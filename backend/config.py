@@ -37,12 +37,24 @@ class Settings(BaseSettings):
     LOG_FILE: str = Field("logs/sim_manager.log", description="Log file path")
     LOG_MAX_SIZE: int = Field(10 * 1024 * 1024, description="Maximum log file size in bytes")  # 10MB
     LOG_BACKUP_COUNT: int = Field(5, description="Number of backup log files")
+    STRUCTURED_LOGGING: bool = Field(False, description="Log one summary record per modem connect instead of step-by-step messages")
     
     # Modem Configuration
     MODEM_BAUDRATE: int = Field(115200, description="Modem baud rate")
     MODEM_TIMEOUT: int = Field(5, description="Modem timeout in seconds")
     MODEM_OPERATION_TIMEOUT: int = Field(10, description="Modem operation timeout in seconds")
+    MODEM_POLL_INTERVAL: float = Field(0.01, description="Longest a serial read blocks before deadlines are rechecked, in seconds")
     MAX_CONCURRENT_MODEMS: int = Field(10, description="Maximum number of concurrent modems")
+    MODEM_IDLE_TTL: int = Field(300, description="Seconds a disconnected modem keeps its port open for reuse")
+    MODEM_DETECTION_CACHE_FILE: str = Field(
+        "~/.sim_manager/modem_cache.json",
+        description="File remembering which ports answered AT probes (empty to disable)"
+    )
+    MODEM_PROBE_TIMEOUT: float = Field(0.5, description="Seconds to wait for each detection probe reply")
+    MODEM_PROBE_CONNECTION_TTL: float = Field(5.0, description="Seconds a port left open by a probe waits to be connected")
+    MODEM_STATUS_CACHE_TTL: float = Field(0.5, description="Seconds a modem status result is reused for repeated polls")
+    MODEM_SIM_INFO_CACHE_TTL: float = Field(5.0, description="Seconds a SIM info result is reused for repeated polls")
+    MODEM_DETECTION_RESULT_TTL: float = Field(10.0, description="Seconds a detection result is reused by monitoring endpoints")
     
     # WebSocket Configuration
     WS_HEARTBEAT_INTERVAL: int = Field(30, description="WebSocket heartbeat interval in seconds")
@@ -7,6 +7,7 @@ operator management, logging, and exception handling.
 
 from .modem_manager import ModemManager
 from .multi_modem_manager import MultiModemManager
+from .modem_pool import ModemPool
 from .operator_manager import OperatorManager
 from .logger import SimManagerLogger, log_operation, log_performance
 from .exceptions import (
@@ -17,6 +18,7 @@ from .exceptions import (
 __all__ = [
     "ModemManager",
     "MultiModemManager", 
+    "ModemPool",
     "OperatorManager",
     "SimManagerLogger",
     "log_operation",
@@ -9,7 +9,6 @@ import logging
 import logging.handlers
 import os
 import sys
-from contextlib import contextmanager
 from typing import Optional, Dict, Any
 from datetime import datetime
 import time
@@ -128,6 +127,10 @@ class SimManagerLogger:
         for handler in self.logger.handlers:
             handler.setLevel(getattr(logging, level.upper()))
     
+    def isEnabledFor(self, level: int) -> bool:
+        """Check whether messages at the given level would be emitted."""
+        return self.logger.isEnabledFor(level)
+    
     # Standard logging methods
     def debug(self, message: str, *args, **kwargs):
         """Log a debug message."""
@@ -219,27 +222,51 @@ def get_websocket_logger() -> logging.Logger:
     return get_logger("websocket")
 
 
-@contextmanager
-def log_operation(logger: logging.Logger, operation_name: str, **context):
+class _OperationLog:
+    """Context manager returned by log_operation."""
+    
+    __slots__ = ("logger", "operation_name", "args", "context", "info_enabled", "start_time")
+    
+    def __init__(self, logger: logging.Logger, operation_name: str, args: tuple, context: Dict[str, Any]):
+        self.logger = logger
+        self.operation_name = operation_name
+        self.args = args
+        self.context = context
+    
+    def __enter__(self):
+        self.start_time = time.time()
+        # Only build the messages when INFO records are emitted at all
+        self.info_enabled = self.logger.isEnabledFor(logging.INFO)
+        if self.info_enabled:
+            if self.args:
+                self.operation_name %= self.args
+            self.logger.info(f"Starting {self.operation_name}", extra={'context': self.context})
+    
+    def __exit__(self, exc_type, exc, traceback) -> bool:
+        if exc_type is None:
+            if self.info_enabled:
+                duration = time.time() - self.start_time
+                self.logger.info(f"Completed {self.operation_name} in {duration:.2f}s", extra={'context': self.context})
+        elif issubclass(exc_type, Exception):
+            if self.args and not self.info_enabled:
+                self.operation_name %= self.args
+            duration = time.time() - self.start_time
+            self.logger.error(f"Failed {self.operation_name} after {duration:.2f}s: {exc}", extra={'context': self.context})
+        return False
+
+
+def log_operation(logger: logging.Logger, operation_name: str, *args, **context) -> _OperationLog:
     """
     Context manager for logging operation execution with timing.
     
     Args:
         logger: Logger instance to use
-        operation_name: Name of the operation being logged
+        operation_name: Name of the operation being logged, a %-format
+            string when args are given
+        *args: Arguments for the operation name, formatted only when logged
         **context: Additional context to log
     """
-    start_time = time.time()
-    logger.info(f"Starting {operation_name}", extra={'context': context})
-    
-    try:
-        yield
-        duration = time.time() - start_time
-        logger.info(f"Completed {operation_name} in {duration:.2f}s", extra={'context': context})
-    except Exception as e:
-        duration = time.time() - start_time
-        logger.error(f"Failed {operation_name} after {duration:.2f}s: {e}", extra={'context': context})
-        raise
+    return _OperationLog(logger, operation_name, args, context)
 
 
 def log_performance(logger: logging.Logger, operation: str, **context):
@@ -251,4 +278,5 @@ def log_performance(logger: logging.Logger, operation: str, **context):
         operation: Operation name
         **context: Additional context
     """
-    logger.debug(f"Performance: {operation}", extra={'context': context})
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Performance: {operation}", extra={'context': context})
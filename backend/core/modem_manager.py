@@ -6,9 +6,19 @@ including connection, AT command execution, SMS, USSD, and SIM card operations.
 """
 
 import asyncio
+import csv
+import functools
+import hashlib
+import os
+import queue
+import selectors
 import serial
 import re
-from typing import Optional, List, Dict, Any, Tuple
+import sys
+import threading
+import time
+from contextlib import nullcontext
+from typing import Optional, List, Dict, Any, Tuple, Callable, Awaitable, Union, AsyncIterator
 from datetime import datetime
 
 from backend.core.logger import SimManagerLogger, log_operation, log_performance
@@ -25,6 +35,106 @@ from backend.models.models import (
 from .ussd_encoder import UssdEncoderDecoder
 
 
+# Final result codes and the SMS "> " prompt, matched on the raw byte stream
+_TERM_RE = re.compile(
+    rb'(?P<ok>\r\nOK\r\n)|(?P<err>\r\n(?:ERROR|\+CM[SE] ERROR[^\r]*)\r\n)|(?P<prompt>\r\n>\s)'
+)
+
+# A complete unsolicited USSD result line: +CUSD: <m>[,"<str>"[,<dcs>]]
+_CUSD_DONE_RE = re.compile(rb'\+CUSD:\s*\d+(?:,"[^"]*"(?:,\d+)?)?\r\n')
+
+# Parsers for decoded AT responses
+_CSQ_RE = re.compile(r'CSQ:\s*(\d+)')
+_COPS_RE = re.compile(r'COPS:\s*(\d+),(\d+),"([^"]+)"(?:,(\d+))?')
+_CREG_RE = re.compile(r'CREG:\s*\d+,(\d+)')
+_CGATT_RE = re.compile(r'CGATT:\s*(\d+)')
+_CNUM_RE = re.compile(r'CNUM:\s*"[^"]*","([^"]+)"')
+_CUSD_RE = re.compile(r'\+CUSD:\s*\d+,"([^"]*)"')
+_CSCS_RE = re.compile(r'\+CSCS:\s*\(([^)]*)\)')
+_QUOTED_RE = re.compile(r'"([^"]+)"')
+
+# Access technology (<AcT>, last +COPS field) per 3GPP TS 27.007
+_ACT_NETWORK_TYPES = {
+    "0": NetworkType.GSM, "1": NetworkType.GSM, "3": NetworkType.GSM, "8": NetworkType.GSM,
+    "2": NetworkType.UMTS, "4": NetworkType.UMTS, "5": NetworkType.UMTS, "6": NetworkType.UMTS,
+    "7": NetworkType.LTE, "9": NetworkType.LTE, "10": NetworkType.LTE,
+    "11": NetworkType.NR, "12": NetworkType.NR, "13": NetworkType.NR,
+}
+
+# +CMGL: <index>,"<stat>","<oa>",[<alpha>],"<scts>" header line (the message is on the next line)
+_CMGL_RE = re.compile(r'^\+CMGL:\s*(.*)$')
+
+# Phone numbers that already carry an international prefix
+_INTERNATIONAL_PREFIXES = ('+', '00')
+
+
+def _parse_scts(value: str) -> datetime:
+    """
+    Parse an SMS service centre timestamp ("24/01/31,12:00:00+04").
+    
+    The format is fixed-width, so the fields are sliced out directly instead
+    of going through strptime. The quarter-hour zone suffix is ignored and
+    a naive local datetime is returned.
+    
+    Raises:
+        ValueError: If the timestamp is malformed
+    """
+    if value[2:3] != "/" or value[5:6] != "/" or value[8:9] != ",":
+        raise ValueError(f"Invalid SMS timestamp: {value!r}")
+    return datetime(
+        2000 + int(value[0:2]), int(value[3:5]), int(value[6:8]),
+        int(value[9:11]), int(value[12:14]), int(value[15:17])
+    )
+
+
+class ATRequest:
+    """
+    A unit of work for the serial worker thread.
+    
+    The worker writes ``data`` (if any), runs ``read`` to collect the reply
+    and hands the result back to the awaiting coroutine on its event loop.
+    """
+    
+    __slots__ = ("data", "read", "future", "loop", "reset_input")
+    
+    def __init__(self, data: Optional[bytes], read: Callable[[], Any],
+                 future: asyncio.Future, loop: asyncio.AbstractEventLoop, reset_input: bool = False):
+        """
+        Initialize the request.
+        
+        Args:
+            data: Bytes to write, or None to only read
+            read: Callable run on the worker thread to collect the reply
+            future: Future resolved with the reply
+            loop: Event loop owning the future
+            reset_input: Whether to discard pending input before writing
+        """
+        self.data = data
+        self.read = read
+        self.future = future
+        self.loop = loop
+        self.reset_input = reset_input
+    
+    def resolve(self, result: Any):
+        """Set the result from the worker thread."""
+        self._complete(self.future.set_result, result)
+    
+    def fail(self, error: BaseException):
+        """Set an exception from the worker thread."""
+        self._complete(self.future.set_exception, error)
+    
+    def _complete(self, setter: Callable[[Any], None], value: Any):
+        def _apply():
+            # The caller may have been cancelled while the request was running
+            if not self.future.done():
+                setter(value)
+        
+        try:
+            self.loop.call_soon_threadsafe(_apply)
+        except RuntimeError:
+            pass  # Event loop already closed
+
+
 class ModemManager:
     """
     Manages a single Huawei USB modem connection and operations.
@@ -34,39 +144,135 @@ class ModemManager:
     commands, and SIM card information retrieval.
     """
     
-    def __init__(self, settings=None):
+    # Fixed AT commands, pre-encoded with their line terminator
+    _AT: Dict[str, bytes] = {
+        "AT": b"AT\r\n",
+        "ATZ": b"ATZ\r\n",
+        "ATF": b"AT&F\r\n",
+        "CGMM": b"AT+CGMM\r\n",
+        "CGMR": b"AT+CGMR\r\n",
+        "CGSN": b"AT+CGSN\r\n",
+        "CPIN": b"AT+CPIN?\r\n",
+        "CIMI": b"AT+CIMI\r\n",
+        "CCID": b"AT+CCID\r\n",
+        "CNUM": b"AT+CNUM\r\n",
+        "CSQ": b"AT+CSQ\r\n",
+        "COPS": b"AT+COPS?\r\n",
+        "CREG": b"AT+CREG?\r\n",
+        "CGATT": b"AT+CGATT?\r\n",
+        "CMGF_TEXT": b"AT+CMGF=1\r\n",
+        "CMGF_PDU": b"AT+CMGF=0\r\n",
+        "CMGL_ALL": b'AT+CMGL="ALL"\r\n',
+        "CSCS_IRA": b'AT+CSCS="IRA"\r\n',
+        "CSCS_GSM": b'AT+CSCS="GSM"\r\n',
+        "CSCS_TEST": b"AT+CSCS=?\r\n",
+    }
+    
+    def __init__(self, settings=None, poll_interval: Optional[float] = None, port: Optional[str] = None):
         """
         Initialize the ModemManager.
         
         Args:
             settings: Application settings object
+            poll_interval: Longest a serial read blocks before deadlines are
+                rechecked, overrides MODEM_POLL_INTERVAL
+            port: Serial port connected to when used as an async context manager
         """
         self.settings = settings or get_settings()
         self.logger = SimManagerLogger(self.settings)
         
         # Connection state
         self.serial_connection: Optional[serial.Serial] = None
-        self.port: Optional[str] = None
+        self.port: Optional[str] = port
         self.is_initialized: bool = False
         
+        # Serial worker: a single thread owns the port and runs queued requests.
+        # Reads block until data arrives; where the port cannot be watched with
+        # a selector, the poll interval bounds how long a read waits before
+        # timeouts and cancellation are rechecked.
+        self._tx_q: queue.SimpleQueue = queue.SimpleQueue()
+        self._worker: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._cancellable_reads = False
+        self._poll_interval = poll_interval or self.settings.MODEM_POLL_INTERVAL
+        
         # Modem information
         self.model: Optional[str] = None
         self.firmware: Optional[str] = None
         self.imei: Optional[str] = None
         
+        # Character set for USSD, chosen once per connection by _detect_charset
+        self._charset = "IRA"
+        self._charset_cmd = self._AT["CSCS_IRA"]
+        self._active_charset: Optional[str] = None
+        
         # SIM information cache
         self._sim_info_cache: Optional[SimInfo] = None
         self._cache_timestamp: Optional[datetime] = None
         self._cache_duration = 300  # 5 minutes cache
+        self._sim_fp: Optional[bytes] = None  # Identity of the SIM last read, see _sim_fingerprint
+        
+        # Operator query cache shared by get_status and get_sim_info
+        self._cops_cache: Optional[Tuple[float, str]] = None
+        self._cops_ttl = 2.0
         
         self.logger.debug("ModemManager initialized")
     
-    async def _connect_to_modem(self, port: str) -> bool:
+    async def __aenter__(self) -> "ModemManager":
+        """
+        Connect to and configure the modem on the port given to the constructor.
+        
+        Raises:
+            SerialPortException: If no port was given or connection fails
+            ATCommandException: If configuration fails
+        """
+        if not self.is_initialized:
+            if self.port is None:
+                raise SerialPortException("No serial port given to connect to")
+            await self.initialize(self.port)
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """Close the modem connection."""
+        # Closing joins the worker thread, keep it off the event loop
+        await asyncio.to_thread(self.close)
+    
+    async def initialize(self, port: str, connection: Optional[serial.Serial] = None) -> bool:
+        """
+        Connect to and configure the modem on a port.
+        
+        The connection is closed again if any step fails.
+        
+        Args:
+            port: Serial port to connect to
+            connection: Already open serial port to take over (see _connect_to_modem)
+            
+        Returns:
+            True if the modem is ready for use
+            
+        Raises:
+            SerialPortException: If connection fails
+            ATCommandException: If configuration fails
+        """
+        try:
+            await self._connect_to_modem(port, connection)
+            await self._configure_modem()
+        except Exception:
+            self.close()
+            raise
+        
+        self.is_initialized = True
+        return True
+    
+    async def _connect_to_modem(self, port: str, connection: Optional[serial.Serial] = None) -> bool:
         """
         Connect to a modem on the specified port.
         
         Args:
             port: Serial port to connect to
+            connection: Already open serial port to take over instead of opening
+                the port again, such as the handle left by a successful detection probe
             
         Returns:
             True if connection successful, False otherwise
@@ -74,38 +280,57 @@ class ModemManager:
         Raises:
             SerialPortException: If connection fails
         """
-        with log_operation(self.logger, f"Connect to modem on {port}"):
+        # With structured logging the caller reports the whole connect in one record
+        structured = self.settings.STRUCTURED_LOGGING
+        with nullcontext() if structured else log_operation(self.logger, f"Connect to modem on {port}"):
             try:
                 # Close existing connection if any
+                self._stop_worker()
                 if self.serial_connection and self.serial_connection.is_open:
                     self.serial_connection.close()
                 
-                # Create new serial connection
-                self.serial_connection = serial.Serial(
-                port=port,
-                    baudrate=self.settings.MODEM_BAUDRATE,
-                    timeout=self.settings.MODEM_TIMEOUT,
-                    bytesize=serial.EIGHTBITS,
-                parity=serial.PARITY_NONE,
-                    stopbits=serial.STOPBITS_ONE
-                )
+                if connection is not None and connection.is_open:
+                    connection.timeout = self._poll_interval
+                    self.serial_connection = connection
+                else:
+                    # Create new serial connection; opening and configuring the TTY
+                    # can take a while, so keep it off the event loop
+                    self.serial_connection = await asyncio.to_thread(
+                        serial.Serial,
+                        port=port,
+                        baudrate=self.settings.MODEM_BAUDRATE,
+                        timeout=self._poll_interval,
+                        bytesize=serial.EIGHTBITS,
+                        parity=serial.PARITY_NONE,
+                        stopbits=serial.STOPBITS_ONE
+                    )
+                
+                # Deliver received bytes immediately instead of on the USB serial
+                # driver's latency timer (16 ms on FTDI-style adapters)
+                try:
+                    self.serial_connection.set_low_latency_mode(True)
+                except (AttributeError, NotImplementedError, OSError, ValueError):
+                    pass
                 
                 self.port = port
-                self.logger.info(f"Serial connection established on {port}")
+                self._start_worker()
+                if not structured:
+                    self.logger.info("Serial connection established on %s", port)
                 
                 # Test AT command to verify modem is responsive
-                response = await self._send_at_command("AT", timeout=3)
+                response = await self._send_at_command(self._AT["AT"], timeout=3)
                 if "OK" not in response:
                     raise SerialPortException(f"Modem on {port} not responsive to AT commands")
                 
-                self.logger.info(f"Modem on {port} is responsive")
+                if not structured:
+                    self.logger.info("Modem on %s is responsive", port)
                 return True
                 
             except serial.SerialException as e:
-                self.logger.error(f"Serial connection failed on {port}: {e}")
+                self.logger.error("Serial connection failed on %s: %s", port, e)
                 raise SerialPortException(f"Failed to connect to {port}: {e}")
             except Exception as e:
-                self.logger.error(f"Unexpected error connecting to {port}: {e}")
+                self.logger.error("Unexpected error connecting to %s: %s", port, e)
                 raise SerialPortException(f"Unexpected error connecting to {port}: {e}")
     
     async def _configure_modem(self) -> bool:
@@ -118,11 +343,14 @@ class ModemManager:
         Raises:
             ATCommandException: If configuration fails
         """
-        with log_operation(self.logger, "Configure modem"):
+        structured = self.settings.STRUCTURED_LOGGING
+        with nullcontext() if structured else log_operation(self.logger, "Configure modem"):
             try:
+                # Reset first: commands following ATZ on the same line are ignored
+                await self._configure_step("ATZ", "Reset modem")
+                
                 # Basic AT commands to configure modem
                 config_commands = [
-                    ("ATZ", "Reset modem"),
                     ("AT&F", "Factory reset"),
                     ("AT+CPIN?", "Check SIM status"),
                     ("AT+CREG?", "Check network registration"),
@@ -135,58 +363,106 @@ class ModemManager:
                     ("AT+COPS=0", "Set automatic operator selection")
                 ]
                 
-                for command, description in config_commands:
-                    try:
-                        self.logger.debug(f"Configuring: {description}")
-                        response = await self._send_at_command(command, timeout=5)
-                        if "ERROR" in response:
-                            self.logger.warning(f"Configuration command failed: {command} - {response}")
-                        else:
-                            self.logger.debug(f"Configuration successful: {description}")
-                    except Exception as e:
-                        self.logger.warning(f"Configuration command failed: {command} - {e}")
+                # Send them as one semicolon-chained line; the modem stops at the
+                # first failing command, so rerun them one by one to find it
+                chained = "AT" + ";".join(command[2:] for command, _ in config_commands)
+                if not await self._configure_step(chained, "Apply configuration"):
+                    for command, description in config_commands:
+                        await self._configure_step(command, description)
+                
+                # Pick the character set used for USSD once per connection
+                await self._detect_charset()
                 
                 # Get modem information
                 await self._get_modem_info()
                 
-                self.logger.info("Modem configuration completed")
+                if not structured:
+                    self.logger.info("Modem configuration completed")
                 return True
                 
             except Exception as e:
-                self.logger.error(f"Modem configuration failed: {e}")
+                self.logger.error("Modem configuration failed: %s", e)
                 raise ATCommandException(f"Failed to configure modem: {e}")
     
+    async def _configure_step(self, command: str, description: str) -> bool:
+        """
+        Send one configuration command, logging rather than raising failures.
+        
+        Args:
+            command: AT command to send
+            description: What the command configures, for logging
+            
+        Returns:
+            True if the modem accepted the command
+        """
+        try:
+            self.logger.debug("Configuring: %s", description)
+            response = await self._send_at_command(command, timeout=5)
+            if "ERROR" in response:
+                self.logger.warning("Configuration command failed: %s - %s", command, response)
+                return False
+            
+            self.logger.debug("Configuration successful: %s", description)
+            return True
+        except Exception as e:
+            self.logger.warning("Configuration command failed: %s - %s", command, e)
+            return False
+    
+    async def _detect_charset(self):
+        """Query the supported character sets and cache the preferred one."""
+        supported = []
+        try:
+            response = await self._send_at_command(self._AT["CSCS_TEST"], timeout=5)
+            match = _CSCS_RE.search(response)
+            if match:
+                supported = _QUOTED_RE.findall(match.group(1))
+        except Exception as e:
+            self.logger.warning("Could not query supported character sets: %s", e)
+        
+        # Prefer IRA (International Reference Alphabet), fall back to GSM
+        self._charset = "GSM" if supported and "IRA" not in supported and "GSM" in supported else "IRA"
+        self._charset_cmd = self._AT[f"CSCS_{self._charset}"]
+        self._active_charset = None
+        self.logger.info("Using character set %s (supported: %s)", self._charset, supported)
+    
+    async def _select_charset(self):
+        """Send the cached character set command unless it is already active."""
+        if self._active_charset == self._charset:
+            return
+        
+        await self._send_at_command(self._charset_cmd, timeout=5)
+        self._active_charset = self._charset
+    
     async def _get_modem_info(self):
         """Get modem model and firmware information."""
         try:
             # Get model information
-            model_response = await self._send_at_command("AT+CGMM")
-            if "OK" in model_response:
-                self.model = model_response.split('\n')[1].strip()
+            model_response = await self._send_at_command(self._AT["CGMM"])
+            self.model = self._extract_value(model_response) or self.model
             
             # Get firmware version
-            firmware_response = await self._send_at_command("AT+CGMR")
-            if "OK" in firmware_response:
-                self.firmware = firmware_response.split('\n')[1].strip()
+            firmware_response = await self._send_at_command(self._AT["CGMR"])
+            self.firmware = self._extract_value(firmware_response) or self.firmware
             
             # Get IMEI
-            imei_response = await self._send_at_command("AT+CGSN")
-            if "OK" in imei_response:
-                self.imei = imei_response.split('\n')[1].strip()
+            imei_response = await self._send_at_command(self._AT["CGSN"])
+            self.imei = self._extract_value(imei_response) or self.imei
             
-            self.logger.info(f"Modem info - Model: {self.model}, Firmware: {self.firmware}, IMEI: {self.imei}")
+            self.logger.info("Modem info - Model: %s, Firmware: %s, IMEI: %s", self.model, self.firmware, self.imei)
             
         except Exception as e:
-            self.logger.warning(f"Failed to get modem info: {e}")
+            self.logger.warning("Failed to get modem info: %s", e)
     
-    async def _send_at_command(self, command: str, timeout: Optional[int] = None, retries: int = 3) -> str:
+    async def _send_at_command(self, command: Union[str, bytes], timeout: Optional[int] = None, retries: int = 3,
+                               reset_input: bool = True) -> str:
         """
         Send an AT command to the modem.
         
         Args:
-            command: AT command to send
+            command: AT command to send, or its wire bytes (see _AT)
             timeout: Command timeout in seconds
             retries: Number of retry attempts
+            reset_input: Whether to discard pending modem output first
             
         Returns:
             Response from the modem
@@ -195,61 +471,512 @@ class ModemManager:
             ATCommandTimeoutException: If command times out
             ATCommandException: If command fails after retries
         """
-        if not self.serial_connection or not self.serial_connection.is_open:
+        if not self._worker_running():
             raise ModemNotConnectedException("Modem is not connected")
         
         timeout = timeout or self.settings.MODEM_OPERATION_TIMEOUT
+        payload = command if isinstance(command, bytes) else f"{command}\r\n".encode()
         last_error = None
         
         for attempt in range(retries):
             try:
-                self.logger.debug(f"Sending AT command (attempt {attempt + 1}): {command}")
-                
-                # Clear input buffer
-                self.serial_connection.reset_input_buffer()
-                
-                # Send command
-                self.serial_connection.write(f"{command}\r\n".encode())
-                
-                # Read response
-                response = ""
-                start_time = asyncio.get_event_loop().time()
-                
-                while asyncio.get_event_loop().time() - start_time < timeout:
-                    if self.serial_connection.in_waiting:
-                        line = self.serial_connection.readline().decode('utf-8', errors='ignore').strip()
-                        response += line + "\n"
-                        
-                        # Check for end of response
-                        if "OK" in line or "ERROR" in line or "FAIL" in line:
-                            break
-                    
-                    await asyncio.sleep(0.1)
-                else:
-                    raise ATCommandTimeoutException(command, timeout)
+                self.logger.debug("Sending AT command (attempt %s): %r", attempt + 1, payload)
+                
+                # Clear input buffer, send command and read response on the worker
+                response, terminator = await self._exchange(
+                    payload, timeout, reset_input=reset_input
+                )
+                if terminator is None:
+                    raise ATCommandTimeoutException(payload.decode().strip(), timeout)
                 
-                self.logger.debug(f"AT command response: {response.strip()}")
+                self.logger.debug("AT command response: %s", response.strip())
                 return response
                 
-            except ATCommandTimeoutException:
-                last_error = ATCommandTimeoutException(command, timeout)
-                self.logger.warning(f"AT command timeout (attempt {attempt + 1}): {command}")
+            except ATCommandTimeoutException as e:
+                last_error = e
+                self.logger.warning("AT command timeout (attempt %s): %r", attempt + 1, payload)
+            except ModemNotConnectedException:
+                raise
             except Exception as e:
-                last_error = ATCommandException(f"Command failed: {command} - {e}")
-                self.logger.error(f"AT command error (attempt {attempt + 1}): {command} - {e}")
+                last_error = ATCommandException(f"Command failed: {payload.decode().strip()} - {e}")
+                self.logger.error("AT command error (attempt %s): %r - %s", attempt + 1, payload, e)
             
             if attempt < retries - 1:
                 await asyncio.sleep(1)  # Wait before retry
         
         # Log performance metrics
         log_performance(self.logger, "at_command_failure", 
-            command=command,
+            command=payload.decode().strip(),
             retries=retries,
             error=str(last_error)
         )
         
         raise last_error
     
+    async def _get_cops(self) -> Optional[str]:
+        """
+        Get the AT+COPS? response, reusing one fetched within the last few seconds.
+        
+        The operator does not change between back-to-back status and SIM
+        polls, so both share a single query.
+        
+        Returns:
+            Response from the modem, or None if the query failed
+        """
+        now = time.monotonic()
+        if self._cops_cache and now - self._cops_cache[0] < self._cops_ttl:
+            return self._cops_cache[1]
+        
+        response = await self._safe_at("COPS", "network operator")
+        if response is not None:
+            self._cops_cache = (now, response)
+        return response
+    
+    async def _safe_at(self, key: str, description: str) -> Optional[str]:
+        """
+        Send a fixed AT command, logging failures instead of raising.
+        
+        Args:
+            key: Command name in _AT
+            description: What the command queries, used in the warning
+            
+        Returns:
+            Response from the modem, or None if the command failed
+        """
+        try:
+            return await self._send_at_command(self._AT[key])
+        except Exception as e:
+            self.logger.warning("Failed to get %s: %s", description, e)
+            return None
+    
+    async def _exchange(self, data: Optional[bytes], timeout: float,
+                        accept_prompt: bool = True, reset_input: bool = False) -> Tuple[str, Optional[str]]:
+        """
+        Write raw bytes and read the reply until a final result code.
+        
+        Args:
+            data: Bytes to write, or None to only read
+            timeout: Maximum time to wait for the reply in seconds
+            accept_prompt: Whether the SMS "> " prompt ends the response
+            reset_input: Whether to discard pending input before writing
+            
+        Returns:
+            Tuple of (decoded response, terminator), see _read_until_terminator
+        """
+        return await self._submit(
+            data, functools.partial(self._read_until_terminator, timeout, accept_prompt), reset_input
+        )
+    
+    async def _await_cusd(self, initial: float = 8, hard_max: float = 30) -> str:
+        """
+        Wait for the unsolicited +CUSD result of a USSD request.
+        
+        Args:
+            initial: Initial deadline in seconds
+            hard_max: Upper bound for the extended deadline in seconds
+            
+        Returns:
+            Decoded modem output received while waiting
+        """
+        return await self._submit(None, functools.partial(self._read_cusd, initial, hard_max))
+    
+    async def _submit(self, data: Optional[bytes], read: Callable[[], Any], reset_input: bool = False) -> Any:
+        """
+        Queue a request for the serial worker and wait for its result.
+        
+        Args:
+            data: Bytes to write, or None to only read
+            read: Callable run on the worker thread to collect the reply
+            reset_input: Whether to discard pending input before writing
+            
+        Returns:
+            Whatever the read callable returned
+            
+        Raises:
+            ModemNotConnectedException: If the worker is not running
+        """
+        if not self._worker_running():
+            raise ModemNotConnectedException("Modem is not connected")
+        
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        future.add_done_callback(self._on_request_done)
+        self._tx_q.put(ATRequest(data, read, future, loop, reset_input))
+        return await future
+    
+    def _on_request_done(self, future: asyncio.Future):
+        """Wake the worker when a caller gives up so an in-flight read ends early."""
+        if future.cancelled():
+            self._wake_worker()
+    
+    async def ping(self, timeout: float) -> bool:
+        """
+        Check that the worker is running and the modem still answers AT.
+        
+        Args:
+            timeout: Seconds to wait for the reply
+            
+        Returns:
+            True if the modem answered OK
+        """
+        if not self._worker_running():
+            return False
+        
+        try:
+            _, terminator = await self._exchange(self._AT["AT"], timeout, reset_input=True)
+        except Exception as e:
+            self.logger.debug("Ping of modem on %s failed: %s", self.port, e)
+            return False
+        return terminator == "ok"
+    
+    def _worker_running(self) -> bool:
+        """Check whether the port is open and owned by a live worker thread."""
+        return (
+            self.serial_connection is not None and self.serial_connection.is_open
+            and self._worker is not None and self._worker.is_alive()
+        )
+    
+    def _start_worker(self):
+        """Start the thread that owns the serial port."""
+        self._stop_event = threading.Event()
+        self._active_request: Optional[ATRequest] = None
+        self._rx_leftover = bytearray()
+        self._tx_q = queue.SimpleQueue()
+        self._open_selector()
+        self._worker = threading.Thread(
+            target=self._serial_pump, name=f"modem-io-{self.port}", daemon=True
+        )
+        self._worker.start()
+    
+    def _stop_worker(self):
+        """Stop the serial worker and fail any requests it did not run."""
+        if self._worker is None:
+            return
+        
+        self._stop_event.set()
+        self._tx_q.put(None)
+        self._wake_worker()
+        if self._worker is not threading.current_thread():
+            self._worker.join(timeout=1)
+            if self._worker.is_alive():
+                # Stuck in a driver call: abort pending I/O so the port can be closed
+                for cancel in ("cancel_read", "cancel_write"):
+                    try:
+                        getattr(self.serial_connection, cancel)()
+                    except Exception:
+                        pass
+                self._worker.join(timeout=1)
+        self._worker = None
+        self._close_selector()
+        
+        while True:
+            try:
+                request = self._tx_q.get_nowait()
+            except queue.Empty:
+                break
+            if request is not None:
+                request.fail(ModemNotConnectedException("Modem is not connected"))
+    
+    def _open_selector(self):
+        """
+        Watch the serial fd and a wake-up pipe with a selector (POSIX only).
+        
+        The worker then sleeps in the kernel until output arrives or it is
+        woken, instead of waking up every poll interval. On Windows the
+        worker instead blocks in pyserial's overlapped read until the
+        deadline and is woken with cancel_read(). Other ports without a
+        selectable fd keep the timed blocking read.
+        """
+        self._selector = None
+        self._cancellable_reads = False
+        if sys.platform == "win32":
+            self._cancellable_reads = hasattr(self.serial_connection, "cancel_read")
+            return
+        
+        try:
+            fd = self.serial_connection.fileno()
+            wake_r, wake_w = os.pipe()
+        except (AttributeError, OSError, ValueError) as e:
+            self.logger.debug("Serial port %s is not selectable, using timed reads: %s", self.port, e)
+            return
+        
+        selector = None
+        try:
+            os.set_blocking(wake_r, False)
+            os.set_blocking(wake_w, False)
+            selector = selectors.DefaultSelector()
+            selector.register(fd, selectors.EVENT_READ)
+            selector.register(wake_r, selectors.EVENT_READ)
+        except (OSError, ValueError) as e:
+            # Do not leak the pipe and selector of a failed setup
+            if selector is not None:
+                selector.close()
+            os.close(wake_r)
+            os.close(wake_w)
+            self.logger.debug("Serial port %s is not selectable, using timed reads: %s", self.port, e)
+            return
+        
+        self._wake_r, self._wake_w = wake_r, wake_w
+        self._selector = selector
+    
+    def _close_selector(self):
+        """Release the selector and wake-up pipe."""
+        if self._selector is None:
+            return
+        
+        self._selector.close()
+        self._selector = None
+        os.close(self._wake_r)
+        os.close(self._wake_w)
+    
+    def _wake_worker(self):
+        """Interrupt a worker blocked waiting for serial output."""
+        if self._selector is not None:
+            try:
+                os.write(self._wake_w, b"\0")
+            except OSError:
+                pass  # Pipe full (a wake-up is already pending) or closed
+        elif self._cancellable_reads:
+            try:
+                self.serial_connection.cancel_read()
+            except Exception:
+                pass  # Port already closed
+    
+    def _serial_pump(self):
+        """
+        Worker thread loop: the only code that touches the serial port.
+        
+        Requests are executed one at a time in submission order, so bytes
+        from concurrent callers can never interleave on the wire.
+        """
+        tx_q = self._tx_q
+        stop_event = self._stop_event
+        
+        while not stop_event.is_set():
+            request = tx_q.get()
+            if request is None:
+                break
+            if request.future.cancelled():
+                continue
+            
+            self._active_request = request
+            try:
+                if request.reset_input:
+                    self.serial_connection.reset_input_buffer()
+                    self._rx_leftover.clear()
+                if request.data:
+                    self.serial_connection.write(request.data)
+                result = request.read()
+            except Exception as e:
+                request.fail(e)
+            else:
+                request.resolve(result)
+            finally:
+                self._active_request = None
+    
+    def _abandoned(self) -> bool:
+        """Check whether the request being read should be given up early."""
+        request = self._active_request
+        return self._stop_event.is_set() or (request is not None and request.future.cancelled())
+    
+    def _read_until_terminator(self, timeout: float, accept_prompt: bool = True) -> Tuple[str, Optional[str]]:
+        """
+        Read modem output until a final result code is received.
+        
+        Runs on the serial worker thread. Output following the terminator is
+        kept for the next read instead of being discarded.
+        
+        Args:
+            timeout: Maximum time to wait in seconds
+            accept_prompt: Whether the SMS "> " prompt ends the response
+            
+        Returns:
+            Tuple of (decoded response, terminator) where terminator is "ok",
+            "err", "prompt", or None if the read timed out
+        """
+        buffer = self._take_leftover()
+        deadline = time.monotonic() + timeout
+        scan_from = 0
+        
+        while True:
+            terminator = None
+            for match in _TERM_RE.finditer(buffer, scan_from):
+                if match.lastgroup != "prompt" or accept_prompt:
+                    terminator = match
+                    break
+            if terminator:
+                self._rx_leftover = buffer[terminator.end():]
+                return self._decode_response(buffer[:terminator.end()]), terminator.lastgroup
+            
+            if time.monotonic() >= deadline or self._abandoned():
+                return self._decode_response(buffer), None
+            
+            chunk = self._read_available(deadline)
+            if chunk:
+                # A terminator completed by new data starts at or after the last CRLF
+                scan_from = max(buffer.rfind(b'\r\n'), 0)
+                buffer += chunk
+    
+    def _read_lines(self, idle_timeout: float, on_line: Callable[[str], None]) -> Optional[str]:
+        """
+        Read modem output line by line until a final result code is received.
+        
+        Every complete line is handed to on_line as soon as it arrives and is
+        then dropped from the buffer, so long listings are not held in memory.
+        The deadline is pushed back whenever output arrives. Runs on the
+        serial worker thread.
+        
+        Args:
+            idle_timeout: Maximum time to wait for further output in seconds
+            on_line: Callback receiving each decoded, stripped line
+            
+        Returns:
+            Terminator "ok" or "err", or None if the read timed out
+        """
+        buffer = self._take_leftover()
+        deadline = time.monotonic() + idle_timeout
+        line_start = 0
+        
+        while True:
+            terminator = None
+            # A terminator starts at the CRLF ending the last handed-over line at the earliest
+            for match in _TERM_RE.finditer(buffer, max(line_start - 2, 0)):
+                if match.lastgroup != "prompt":
+                    terminator = match
+                    break
+            
+            end = terminator.start() if terminator else buffer.rfind(b'\n', line_start) + 1
+            if end > line_start:
+                lines = buffer[line_start:end].split(b'\n')
+                if not lines[-1]:
+                    lines.pop()
+                for line in lines:
+                    on_line(line.decode('utf-8', errors='ignore').strip())
+                line_start = end
+            
+            if terminator:
+                self._rx_leftover = buffer[terminator.end():]
+                return terminator.lastgroup
+            
+            if time.monotonic() >= deadline or self._abandoned():
+                return None
+            
+            if line_start > 4096:
+                del buffer[:line_start - 2]
+                line_start = 2
+            
+            chunk = self._read_available(deadline)
+            if chunk:
+                buffer += chunk
+                deadline = time.monotonic() + idle_timeout
+    
+    def _read_cusd(self, initial: float, hard_max: float) -> str:
+        """
+        Read modem output until a complete +CUSD line or an error arrives.
+        
+        The deadline starts short and is only extended while the network is
+        visibly answering (a +CUSD header has arrived but the line is still
+        open), so requests the network never picks up fail fast. Runs on the
+        serial worker thread.
+        
+        Args:
+            initial: Initial deadline in seconds
+            hard_max: Upper bound for the extended deadline in seconds
+            
+        Returns:
+            Decoded modem output received while waiting
+        """
+        buffer = self._take_leftover()
+        start_time = time.monotonic()
+        deadline = start_time + initial
+        hard_deadline = start_time + hard_max
+        
+        while True:
+            done = _CUSD_DONE_RE.search(buffer)
+            if done:
+                self._rx_leftover = buffer[done.end():]
+                return self._decode_response(buffer[:done.end()])
+            
+            match = _TERM_RE.search(buffer)
+            if match and match.lastgroup == "err":
+                break
+            if b'+CUSD:' in buffer:
+                deadline = min(max(deadline, time.monotonic() + 4), hard_deadline)
+            
+            if time.monotonic() >= deadline or self._abandoned():
+                break
+            
+            buffer += self._read_available(deadline)
+        
+        return self._decode_response(buffer)
+    
+    def _read_available(self, deadline: float) -> bytes:
+        """
+        Block until modem output arrives, the deadline passes or the worker is woken.
+        
+        On Windows a single overlapped read waits for the whole remaining
+        time. Otherwise, without a selector, the port timeout (the poll
+        interval) bounds each read, so the caller rechecks its deadline at
+        that rate. Runs on the serial worker thread.
+        
+        Args:
+            deadline: time.monotonic() value after which to stop waiting
+            
+        Returns:
+            All output received so far, or b"" if nothing arrived
+        """
+        if self._cancellable_reads:
+            self.serial_connection.timeout = max(deadline - time.monotonic(), 0)
+            data = self.serial_connection.read(1)
+            waiting = self.serial_connection.in_waiting if data else 0
+            return data + self.serial_connection.read(waiting) if waiting else data
+        
+        if self._selector is None:
+            return self.serial_connection.read(self.serial_connection.in_waiting or 1)
+        
+        waiting = self.serial_connection.in_waiting
+        if not waiting:
+            for key, _ in self._selector.select(max(deadline - time.monotonic(), 0)):
+                if key.fd == self._wake_r:
+                    try:
+                        os.read(self._wake_r, 512)
+                    except BlockingIOError:
+                        pass
+            waiting = self.serial_connection.in_waiting
+        
+        return self.serial_connection.read(waiting) if waiting else b""
+    
+    def _take_leftover(self) -> bytearray:
+        """Hand over output received after the previous response ended."""
+        buffer, self._rx_leftover = self._rx_leftover, bytearray()
+        return buffer
+    
+    def _decode_response(self, raw: bytes) -> str:
+        """Decode raw modem output into newline-separated, stripped lines."""
+        lines = raw.decode('utf-8', errors='ignore').split('\n')
+        if not lines[-1]:
+            lines.pop()
+        return "".join(f"{line.strip()}\n" for line in lines)
+    
+    @staticmethod
+    def _extract_value(response: Optional[str]) -> Optional[str]:
+        """
+        Get the value line of a successful single-value AT response.
+        
+        Args:
+            response: Decoded response such as "\\nE3531\\n\\nOK\\n"
+            
+        Returns:
+            The last non-empty line before the final OK, or None
+        """
+        if not response:
+            return None
+        
+        body, ok, _ = response.rpartition("\nOK")
+        if not ok:
+            return None
+        return body.rstrip().rpartition("\n")[2].strip() or None
+    
     async def get_status(self) -> ModemStatus:
         """
         Get current modem status.
@@ -276,47 +1003,50 @@ class ModemManager:
                         error="Serial connection lost"
                     )
                 
+                # Queue the independent queries together; the serial worker runs
+                # them back-to-back without a round trip through the event loop
+                csq_response, cops_response, creg_response = await asyncio.gather(
+                    self._safe_at("CSQ", "signal strength"),
+                    self._get_cops(),
+                    self._safe_at("CREG", "network registration"),
+                )
+                
                 # Get signal strength
                 signal_strength = None
-                try:
-                    csq_response = await self._send_at_command("AT+CSQ")
-                    if "CSQ:" in csq_response:
-                        csq_match = re.search(r'CSQ:\s*(\d+)', csq_response)
-                        if csq_match:
-                            raw_signal = int(csq_match.group(1))
-                            # Convert to percentage (0-31 -> 0-100)
-                            signal_strength = min(100, int((raw_signal / 31) * 100))
-                except Exception as e:
-                    self.logger.warning(f"Failed to get signal strength: {e}")
+                if csq_response and "CSQ:" in csq_response:
+                    csq_match = _CSQ_RE.search(csq_response)
+                    if csq_match:
+                        raw_signal = int(csq_match.group(1))
+                        # Convert to percentage (0-31 -> 0-100)
+                        signal_strength = min(100, int((raw_signal / 31) * 100))
                 
                 # Get network registration status
                 operator = None
                 network_type = NetworkType.UNKNOWN
                 try:
-                    cops_response = await self._send_at_command("AT+COPS?")
-                    if "COPS:" in cops_response:
-                        cops_match = re.search(r'COPS:\s*\d+,(\d+),"([^"]+)"', cops_response)
+                    if cops_response and "COPS:" in cops_response:
+                        cops_match = _COPS_RE.search(cops_response)
                         if cops_match:
-                            operator = cops_match.group(2)
+                            operator = cops_match.group(3)
+                            network_type = _ACT_NETWORK_TYPES.get(cops_match.group(4), NetworkType.UNKNOWN)
                     
-                    # Get network type
-                    creg_response = await self._send_at_command("AT+CREG?")
-                    if "CREG:" in creg_response:
-                        creg_match = re.search(r'CREG:\s*\d+,(\d+)', creg_response)
+                    # Without an access technology in +COPS, fall back to GPRS attachment
+                    if network_type == NetworkType.UNKNOWN and creg_response and "CREG:" in creg_response:
+                        creg_match = _CREG_RE.search(creg_response)
                         if creg_match:
                             reg_status = int(creg_match.group(1))
                             if reg_status in [1, 5]:  # Registered
                                 # Try to get network type from CGATT
                                 try:
-                                    cgatt_response = await self._send_at_command("AT+CGATT?")
+                                    cgatt_response = await self._send_at_command(self._AT["CGATT"])
                                     if "CGATT:" in cgatt_response:
-                                        cgatt_match = re.search(r'CGATT:\s*(\d+)', cgatt_response)
+                                        cgatt_match = _CGATT_RE.search(cgatt_response)
                                         if cgatt_match and cgatt_match.group(1) == "1":
                                             network_type = NetworkType.LTE  # Assume LTE if GPRS attached
                                 except:
                                     pass
                 except Exception as e:
-                    self.logger.warning(f"Failed to get network info: {e}")
+                    self.logger.warning("Failed to get network info: %s", e)
                 
                 return ModemStatus(
                     connected=True,
@@ -330,7 +1060,7 @@ class ModemManager:
                 )
                 
             except Exception as e:
-                self.logger.error(f"Failed to get modem status: {e}")
+                self.logger.error("Failed to get modem status: %s", e)
                 return ModemStatus(
                     connected=False,
                     modem_id=f"huawei_{self.port}" if self.port else None,
@@ -356,51 +1086,42 @@ class ModemManager:
                 return self._sim_info_cache
             
             try:
+                # Queue all queries together; the serial worker runs them
+                # back-to-back without a round trip through the event loop
+                (cpin_response, cimi_response, cccid_response, cnumn_response,
+                 csq_response, cops_response) = await asyncio.gather(
+                    self._send_at_command(self._AT["CPIN"]),
+                    self._safe_at("CIMI", "IMSI"),
+                    self._safe_at("CCID", "ICCID"),
+                    self._safe_at("CNUM", "MSISDN"),
+                    self._safe_at("CSQ", "signal strength"),
+                    self._get_cops(),
+                )
+                
                 # Check SIM status
-                cpin_response = await self._send_at_command("AT+CPIN?")
                 if "READY" not in cpin_response:
                     raise SimCardNotDetectedException("SIM card not ready")
                 
                 # Get IMSI
-                imsi = None
-                try:
-                    cimi_response = await self._send_at_command("AT+CIMI")
-                    if "OK" in cimi_response:
-                        imsi = cimi_response.split('\n')[1].strip()
-                except Exception as e:
-                    self.logger.warning(f"Failed to get IMSI: {e}")
+                imsi = self._extract_value(cimi_response)
                 
                 # Get ICCID
-                iccid = None
-                try:
-                    cccid_response = await self._send_at_command("AT+CCID")
-                    if "OK" in cccid_response:
-                        iccid = cccid_response.split('\n')[1].strip()
-                except Exception as e:
-                    self.logger.warning(f"Failed to get ICCID: {e}")
+                iccid = self._extract_value(cccid_response)
                 
                 # Get MSISDN (phone number)
                 msisdn = None
-                try:
-                    cnumn_response = await self._send_at_command("AT+CNUM")
-                    if "CNUM:" in cnumn_response:
-                        cnum_match = re.search(r'CNUM:\s*"[^"]*","([^"]+)"', cnumn_response)
-                        if cnum_match:
-                            msisdn = cnum_match.group(1)
-                except Exception as e:
-                    self.logger.warning(f"Failed to get MSISDN: {e}")
+                if cnumn_response and "CNUM:" in cnumn_response:
+                    cnum_match = _CNUM_RE.search(cnumn_response)
+                    if cnum_match:
+                        msisdn = cnum_match.group(1)
                 
                 # Get signal strength
                 signal_strength = None
-                try:
-                    csq_response = await self._send_at_command("AT+CSQ")
-                    if "CSQ:" in csq_response:
-                        csq_match = re.search(r'CSQ:\s*(\d+)', csq_response)
-                        if csq_match:
-                            raw_signal = int(csq_match.group(1))
-                            signal_strength = min(100, int((raw_signal / 31) * 100))
-                except Exception as e:
-                    self.logger.warning(f"Failed to get signal strength: {e}")
+                if csq_response and "CSQ:" in csq_response:
+                    csq_match = _CSQ_RE.search(csq_response)
+                    if csq_match:
+                        raw_signal = int(csq_match.group(1))
+                        signal_strength = min(100, int((raw_signal / 31) * 100))
                 
                 # Get operator information
                 operator_name = None
@@ -408,15 +1129,12 @@ class ModemManager:
                 roaming = False
                 network_type = NetworkType.UNKNOWN
                 
-                try:
-                    cops_response = await self._send_at_command("AT+COPS?")
-                    if "COPS:" in cops_response:
-                        cops_match = re.search(r'COPS:\s*(\d+),(\d+),"([^"]+)"', cops_response)
-                        if cops_match:
-                            operator_name = cops_match.group(3)
-                            roaming = cops_match.group(1) == "2"
-                except Exception as e:
-                    self.logger.warning(f"Failed to get operator info: {e}")
+                if cops_response and "COPS:" in cops_response:
+                    cops_match = _COPS_RE.search(cops_response)
+                    if cops_match:
+                        operator_name = cops_match.group(3)
+                        roaming = cops_match.group(1) == "2"
+                        network_type = _ACT_NETWORK_TYPES.get(cops_match.group(4), NetworkType.UNKNOWN)
                 
                 # Create SIM info object
                 sim_info = SimInfo(
@@ -430,6 +1148,12 @@ class ModemManager:
                     network_type=network_type
                 )
                 
+                # Detect a swapped SIM by identity rather than comparing every field
+                fingerprint = self._sim_fingerprint(sim_info)
+                if self._sim_fp is not None and fingerprint != self._sim_fp:
+                    self.logger.info("SIM card changed on %s (IMSI %s)", self.port, imsi)
+                self._sim_fp = fingerprint
+                
                 # Cache the result
                 self._sim_info_cache = sim_info
                 self._cache_timestamp = datetime.now()
@@ -437,9 +1161,122 @@ class ModemManager:
                 return sim_info
                 
             except Exception as e:
-                self.logger.error(f"Failed to get SIM info: {e}")
+                self.logger.error("Failed to get SIM info: %s", e)
                 raise SimCardNotDetectedException(f"Failed to get SIM info: {e}")
     
+    @staticmethod
+    def _sim_fingerprint(info: SimInfo) -> bytes:
+        """
+        Get a short digest of the identity fields of a SIM.
+        
+        Args:
+            info: SIM information
+            
+        Returns:
+            8-byte digest of the IMSI and ICCID
+        """
+        return hashlib.blake2b(f"{info.imsi or ''}|{info.iccid or ''}".encode(), digest_size=8).digest()
+    
+    async def iter_sms(self) -> AsyncIterator[SmsMessage]:
+        """
+        Stream SMS messages from the modem as they are read.
+        
+        Messages are yielded while the AT+CMGL listing is still arriving. A
+        message that cannot be parsed is logged and skipped.
+        
+        Yields:
+            SmsMessage objects in modem storage order
+            
+        Raises:
+            SmsReadException: If the modem rejects the listing or stops responding
+        """
+        # Set SMS text mode
+        await self._send_at_command(self._AT["CMGF_TEXT"])
+        
+        loop = asyncio.get_running_loop()
+        messages: asyncio.Queue = asyncio.Queue()
+        draining = threading.Event()
+        modem_id = f"huawei_{self.port}" if self.port else None
+        header = None
+        
+        def on_line(line: str):
+            # Runs on the serial worker thread, so parsing stays off the event loop
+            nonlocal header
+            if draining.is_set():
+                return
+            
+            match = _CMGL_RE.match(line)
+            if match:
+                header = match.group(1)
+            elif header is not None:
+                # The line after a header is the message content
+                sms_message = self._parse_sms(header, line, modem_id)
+                header = None
+                if sms_message:
+                    loop.call_soon_threadsafe(messages.put_nowait, sms_message)
+        
+        listing = asyncio.ensure_future(self._submit(
+            self._AT["CMGL_ALL"],
+            functools.partial(self._read_lines, self.settings.MODEM_OPERATION_TIMEOUT, on_line),
+            reset_input=True
+        ))
+        # Messages are queued before the listing completes, so this always comes last
+        listing.add_done_callback(lambda _: messages.put_nowait(None))
+        
+        try:
+            while True:
+                sms_message = await messages.get()
+                if sms_message is None:
+                    break
+                yield sms_message
+            
+            terminator = listing.result()
+            if terminator != "ok":
+                reason = "modem returned an error" if terminator else "timed out"
+                raise SmsReadException(f"Failed to list SMS messages: {reason}")
+        finally:
+            if not listing.done():
+                # The caller stopped early: let the listing run to its final result
+                # code so its tail is not read as the response to the next command
+                draining.set()
+                listing.add_done_callback(lambda f: f.cancelled() or f.exception())
+    
+    def _parse_sms(self, header: str, content: str, modem_id: Optional[str]) -> Optional[SmsMessage]:
+        """
+        Build an SmsMessage from a +CMGL header and its content line.
+        
+        Args:
+            header: Header fields following "+CMGL:"
+            content: Message content line
+            modem_id: Modem identifier to attach to the message
+            
+        Returns:
+            SmsMessage object, or None if the header cannot be parsed
+        """
+        try:
+            # csv keeps quoted fields with commas (timestamps, names) intact
+            parts = next(csv.reader([header], skipinitialspace=True))
+            if len(parts) < 5:
+                return None
+            
+            # Parse timestamp
+            try:
+                timestamp = _parse_scts(parts[4])
+            except ValueError:
+                timestamp = datetime.now()
+            
+            return SmsMessage(
+                id=int(parts[0]),
+                modem_id=modem_id,
+                status=SmsStatus(parts[1]),
+                phone_number=parts[2],
+                message=content,
+                timestamp=timestamp
+            )
+        except Exception as e:
+            self.logger.warning("Failed to parse SMS message: %s", e)
+            return None
+    
     async def get_sms_messages(self) -> List[SmsMessage]:
         """
         Get all SMS messages from the modem.
@@ -452,61 +1289,13 @@ class ModemManager:
         """
         with log_operation(self.logger, "Get SMS messages"):
             try:
-                # Set SMS text mode
-                await self._send_at_command("AT+CMGF=1")
-                
-                # Get SMS messages
-                response = await self._send_at_command("AT+CMGL=\"ALL\"")
+                messages = [sms_message async for sms_message in self.iter_sms()]
                 
-                messages = []
-                if "OK" in response:
-                    lines = response.split('\n')
-                    i = 0
-                    while i < len(lines):
-                        line = lines[i].strip()
-                        
-                        # Parse SMS message header
-                        if line.startswith('+CMGL:'):
-                            try:
-                                # Extract SMS details
-                                parts = line.split(',')
-                                if len(parts) >= 5:
-                                    message_id = int(parts[0].split(':')[1])
-                                    status = parts[1].strip('"')
-                                    phone_number = parts[2].strip('"')
-                                    timestamp_str = f"{parts[4]} {parts[5]}"
-                                    
-                                    # Get message content
-                                    i += 1
-                                    if i < len(lines):
-                                        message_content = lines[i].strip()
-                                        
-                                        # Parse timestamp
-                                        try:
-                                            timestamp = datetime.strptime(timestamp_str, "%y/%m/%d,%H:%M:%S%z")
-                                        except:
-                                            timestamp = datetime.now()
-                                        
-                                        # Create SMS message object
-                                        sms_message = SmsMessage(
-                                            id=message_id,
-                                            modem_id=f"huawei_{self.port}" if self.port else None,
-                                            status=SmsStatus(status),
-                                            phone_number=phone_number,
-                                            message=message_content,
-                                            timestamp=timestamp
-                                        )
-                                        messages.append(sms_message)
-                            except Exception as e:
-                                self.logger.warning(f"Failed to parse SMS message: {e}")
-                        
-                        i += 1
-                
-                self.logger.info(f"Retrieved {len(messages)} SMS messages")
+                self.logger.info("Retrieved %s SMS messages", len(messages))
                 return messages
                 
             except Exception as e:
-                self.logger.error(f"Failed to get SMS messages: {e}")
+                self.logger.error("Failed to get SMS messages: %s", e)
                 raise SmsReadException(f"Failed to read SMS messages: {e}")
     
     async def send_sms(self, number: str, message: str) -> bool:
@@ -529,80 +1318,82 @@ class ModemManager:
                 if not self.serial_connection or not self.serial_connection.is_open:
                     raise SmsSendException("Modem is not connected")
                 
-                self.logger.info(f"Modem connection status: {self.serial_connection.is_open}")
-                self.logger.info(f"Modem port: {self.port}")
-                self.logger.info(f"Modem initialized: {self.is_initialized}")
+                self.logger.info("Modem connection status: %s", self.serial_connection.is_open)
+                self.logger.info("Modem port: %s", self.port)
+                self.logger.info("Modem initialized: %s", self.is_initialized)
                 
                 # Test basic AT command first
                 try:
-                    test_response = await self._send_at_command("AT", timeout=5)
-                    self.logger.info(f"AT test response: {test_response}")
+                    test_response = await self._send_at_command(self._AT["AT"], timeout=5)
+                    self.logger.info("AT test response: %s", test_response)
                 except Exception as e:
-                    self.logger.error(f"AT test failed: {e}")
+                    self.logger.error("AT test failed: %s", e)
                     raise SmsSendException(f"Modem not responsive: {e}")
                 
                 # Check SIM status
                 try:
-                    cpin_response = await self._send_at_command("AT+CPIN?", timeout=5)
-                    self.logger.info(f"SIM status response: {cpin_response}")
+                    cpin_response = await self._send_at_command(self._AT["CPIN"], timeout=5)
+                    self.logger.info("SIM status response: %s", cpin_response)
                     if "READY" not in cpin_response:
                         raise SmsSendException("SIM card not ready")
                 except Exception as e:
-                    self.logger.warning(f"Could not check SIM status: {e}")
+                    self.logger.warning("Could not check SIM status: %s", e)
                 
                 # Check network registration
                 try:
-                    creg_response = await self._send_at_command("AT+CREG?", timeout=5)
-                    self.logger.info(f"Network registration response: {creg_response}")
+                    creg_response = await self._send_at_command(self._AT["CREG"], timeout=5)
+                    self.logger.info("Network registration response: %s", creg_response)
                     if "0,1" not in creg_response and "0,5" not in creg_response:
                         self.logger.warning("Network not registered, SMS may fail")
                 except Exception as e:
-                    self.logger.warning(f"Could not check network registration: {e}")
+                    self.logger.warning("Could not check network registration: %s", e)
                 
                 # Reset SMS configuration
                 try:
-                    await self._send_at_command("ATZ", timeout=5)  # Reset to default
-                    await self._send_at_command("AT&F", timeout=5)  # Factory reset
+                    await self._send_at_command(self._AT["ATZ"], timeout=5)  # Reset to default
+                    await self._send_at_command(self._AT["ATF"], timeout=5)  # Factory reset
                 except Exception as e:
-                    self.logger.warning(f"Could not reset modem: {e}")
+                    self.logger.warning("Could not reset modem: %s", e)
                 
                 # Set SMS text mode
                 try:
-                    await self._send_at_command("AT+CMGF=1", timeout=5)
+                    await self._send_at_command(self._AT["CMGF_TEXT"], timeout=5)
                     self.logger.info("SMS text mode set successfully")
                 except Exception as e:
-                    self.logger.error(f"Failed to set SMS text mode: {e}")
+                    self.logger.error("Failed to set SMS text mode: %s", e)
                     raise SmsSendException(f"Failed to set SMS text mode: {e}")
                 
                 # Set character set
+                self._active_charset = None
                 try:
-                    await self._send_at_command("AT+CSCS=\"GSM\"", timeout=5)
+                    await self._send_at_command(self._AT["CSCS_GSM"], timeout=5)
+                    self._active_charset = "GSM"
                     self.logger.info("Character set set to GSM")
                 except Exception as e:
-                    self.logger.warning(f"Could not set character set: {e}")
+                    self.logger.warning("Could not set character set: %s", e)
                 
                 # Check signal strength before sending
                 try:
-                    csq_response = await self._send_at_command("AT+CSQ", timeout=5)
-                    self.logger.info(f"Signal strength response: {csq_response}")
+                    csq_response = await self._send_at_command(self._AT["CSQ"], timeout=5)
+                    self.logger.info("Signal strength response: %s", csq_response)
                     if "CSQ:" in csq_response:
-                        csq_match = re.search(r'CSQ:\s*(\d+)', csq_response)
+                        csq_match = _CSQ_RE.search(csq_response)
                         if csq_match:
                             signal = int(csq_match.group(1))
                             if signal == 99:  # No signal
                                 raise SmsSendException("No signal available for SMS sending")
                 except Exception as e:
-                    self.logger.warning(f"Could not check signal strength: {e}")
+                    self.logger.warning("Could not check signal strength: %s", e)
                 
                 # Validate phone number format
-                if not number.startswith('+') and not number.startswith('00'):
+                if not number.startswith(_INTERNATIONAL_PREFIXES):
                     # Add country code if not present (assuming Algeria +213)
                     if number.startswith('0'):
                         number = '+213' + number[1:]
                     else:
                         number = '+213' + number
                 
-                self.logger.info(f"Formatted phone number: {number}")
+                self.logger.info("Formatted phone number: %s", number)
                 
                 # Try alternative SMS sending methods
                 success = False
@@ -614,7 +1405,7 @@ class ModemManager:
                     if success:
                         return True
                 except Exception as e:
-                    self.logger.warning(f"Method 1 failed: {e}")
+                    self.logger.warning("Method 1 failed: %s", e)
                 
                 # Method 2: AT+CMGS with different format
                 try:
@@ -623,7 +1414,7 @@ class ModemManager:
                     if success:
                         return True
                 except Exception as e:
-                    self.logger.warning(f"Method 2 failed: {e}")
+                    self.logger.warning("Method 2 failed: %s", e)
                 
                 # Method 3: AT+CMGS with PDU mode
                 try:
@@ -632,45 +1423,37 @@ class ModemManager:
                     if success:
                         return True
                 except Exception as e:
-                    self.logger.warning(f"Method 3 failed: {e}")
+                    self.logger.warning("Method 3 failed: %s", e)
                 
                 raise SmsSendException("All SMS sending methods failed")
                 
             except Exception as e:
-                self.logger.error(f"Failed to send SMS to {number}: {e}")
+                self.logger.error("Failed to send SMS to %s: %s", number, e)
                 raise SmsSendException(f"Failed to send SMS: {e}")
     
     async def _send_sms_method1(self, number: str, message: str) -> bool:
         """Method 1: Standard AT+CMGS with text mode."""
         sms_command = f'AT+CMGS="{number}"'
-        self.logger.info(f"Sending SMS command: {sms_command}")
+        self.logger.info("Sending SMS command: %s", sms_command)
         response = await self._send_at_command(sms_command, timeout=15)
-        self.logger.info(f"SMS command response: {response}")
+        self.logger.info("SMS command response: %s", response)
         
         if ">" in response:
             # Send message content with Ctrl+Z terminator
             message_with_terminator = f"{message}\x1A"
-            self.logger.info(f"Sending message content: {message[:20]}...")
-            self.serial_connection.write(message_with_terminator.encode())
+            self.logger.info("Sending message content: %s...", message[:20])
             
             # Wait for final response with longer timeout
-            final_response = ""
-            start_time = asyncio.get_event_loop().time()
-            timeout = 30  # SMS sending timeout
+            final_response, terminator = await self._exchange(
+                message_with_terminator.encode(), 30, accept_prompt=False
+            )
+            self.logger.debug("Received response: %s", final_response)
             
-            while asyncio.get_event_loop().time() - start_time < timeout:
-                if self.serial_connection.in_waiting:
-                    line = self.serial_connection.readline().decode('utf-8', errors='ignore').strip()
-                    final_response += line + "\n"
-                    self.logger.debug(f"Received line: {line}")
-                    
-                    if "OK" in line:
-                        self.logger.info(f"SMS sent successfully to {number}")
-                        return True
-                    elif "ERROR" in line or "FAIL" in line:
-                        raise SmsSendException(f"SMS send failed: {line}")
-                
-                await asyncio.sleep(0.1)
+            if terminator == "ok":
+                self.logger.info("SMS sent successfully to %s", number)
+                return True
+            elif terminator == "err":
+                raise SmsSendException(f"SMS send failed: {final_response}")
             
             # If we get here, it timed out
             raise SmsSendException(f"SMS send timed out. Response: {final_response}")
@@ -681,32 +1464,24 @@ class ModemManager:
         """Method 2: AT+CMGS with different number format."""
         # Try without quotes
         sms_command = f'AT+CMGS={number}'
-        self.logger.info(f"Sending SMS command (Method 2): {sms_command}")
+        self.logger.info("Sending SMS command (Method 2): %s", sms_command)
         response = await self._send_at_command(sms_command, timeout=15)
-        self.logger.info(f"SMS command response: {response}")
+        self.logger.info("SMS command response: %s", response)
         
         if ">" in response:
             # Send message content with Ctrl+Z terminator
             message_with_terminator = f"{message}\x1A"
-            self.serial_connection.write(message_with_terminator.encode())
             
             # Wait for final response
-            final_response = ""
-            start_time = asyncio.get_event_loop().time()
-            timeout = 30
+            final_response, terminator = await self._exchange(
+                message_with_terminator.encode(), 30, accept_prompt=False
+            )
             
-            while asyncio.get_event_loop().time() - start_time < timeout:
-                if self.serial_connection.in_waiting:
-                    line = self.serial_connection.readline().decode('utf-8', errors='ignore').strip()
-                    final_response += line + "\n"
-                    
-                    if "OK" in line:
-                        self.logger.info(f"SMS sent successfully to {number} (Method 2)")
-                        return True
-                    elif "ERROR" in line or "FAIL" in line:
-                        raise SmsSendException(f"SMS send failed: {line}")
-                
-                await asyncio.sleep(0.1)
+            if terminator == "ok":
+                self.logger.info("SMS sent successfully to %s (Method 2)", number)
+                return True
+            elif terminator == "err":
+                raise SmsSendException(f"SMS send failed: {final_response}")
             
             raise SmsSendException(f"SMS send timed out. Response: {final_response}")
         else:
@@ -715,45 +1490,37 @@ class ModemManager:
     async def _send_sms_method3(self, number: str, message: str) -> bool:
         """Method 3: PDU mode SMS sending."""
         # Set PDU mode
-        await self._send_at_command("AT+CMGF=0", timeout=5)
+        await self._send_at_command(self._AT["CMGF_PDU"], timeout=5)
         
         # For PDU mode, we need to encode the message properly
         # This is a simplified version - in production you'd need proper PDU encoding
         try:
             # Try to send with PDU mode
             sms_command = f'AT+CMGS={len(message)}'
-            self.logger.info(f"Sending SMS command (PDU mode): {sms_command}")
+            self.logger.info("Sending SMS command (PDU mode): %s", sms_command)
             response = await self._send_at_command(sms_command, timeout=15)
             
             if ">" in response:
                 # Send PDU data (simplified)
                 pdu_data = "000100" + number + "0000" + message.encode('hex').upper()
-                self.serial_connection.write((pdu_data + "\x1A").encode())
                 
                 # Wait for response
-                final_response = ""
-                start_time = asyncio.get_event_loop().time()
-                timeout = 30
-                
-                while asyncio.get_event_loop().time() - start_time < timeout:
-                    if self.serial_connection.in_waiting:
-                        line = self.serial_connection.readline().decode('utf-8', errors='ignore').strip()
-                        final_response += line + "\n"
-                        
-                        if "OK" in line:
-                            self.logger.info(f"SMS sent successfully to {number} (PDU mode)")
-                            return True
-                        elif "ERROR" in line or "FAIL" in line:
-                            raise SmsSendException(f"SMS send failed: {line}")
-                    
-                    await asyncio.sleep(0.1)
+                final_response, terminator = await self._exchange(
+                    (pdu_data + "\x1A").encode(), 30, accept_prompt=False
+                )
+                
+                if terminator == "ok":
+                    self.logger.info("SMS sent successfully to %s (PDU mode)", number)
+                    return True
+                elif terminator == "err":
+                    raise SmsSendException(f"SMS send failed: {final_response}")
                 
                 raise SmsSendException(f"SMS send timed out. Response: {final_response}")
             else:
                 raise SmsSendException(f"SMS send failed: {response}")
         finally:
             # Reset to text mode
-            await self._send_at_command("AT+CMGF=1", timeout=5)
+            await self._send_at_command(self._AT["CMGF_TEXT"], timeout=5)
     
     async def delete_sms(self, message_id: int) -> bool:
         """
@@ -774,13 +1541,13 @@ class ModemManager:
                 response = await self._send_at_command(f"AT+CMGD={message_id}")
                 
                 if "OK" in response:
-                    self.logger.info(f"SMS {message_id} deleted successfully")
+                    self.logger.info("SMS %s deleted successfully", message_id)
                     return True
                 else:
                     raise SmsDeleteException(f"SMS deletion failed: {response}")
                 
             except Exception as e:
-                self.logger.error(f"Failed to delete SMS {message_id}: {e}")
+                self.logger.error("Failed to delete SMS %s: %s", message_id, e)
                 raise SmsDeleteException(f"Failed to delete SMS: {e}")
     
     async def send_ussd(self, command: str) -> UssdResponse:
@@ -805,94 +1572,60 @@ class ModemManager:
                 
                 # Test basic AT command first
                 try:
-                    test_response = await self._send_at_command("AT", timeout=5)
-                    self.logger.info(f"AT test response: {test_response}")
+                    test_response = await self._send_at_command(self._AT["AT"], timeout=5)
+                    self.logger.info("AT test response: %s", test_response)
                 except Exception as e:
-                    self.logger.error(f"AT test failed: {e}")
+                    self.logger.error("AT test failed: %s", e)
                     raise UssdException(f"Modem not responsive: {e}")
                 
                 # Check SIM status
                 try:
-                    cpin_response = await self._send_at_command("AT+CPIN?", timeout=5)
-                    self.logger.info(f"SIM status response: {cpin_response}")
+                    cpin_response = await self._send_at_command(self._AT["CPIN"], timeout=5)
+                    self.logger.info("SIM status response: %s", cpin_response)
                     if "READY" not in cpin_response:
                         raise UssdException("SIM card not ready")
                 except Exception as e:
-                    self.logger.warning(f"Could not check SIM status: {e}")
+                    self.logger.warning("Could not check SIM status: %s", e)
                 
                 # Check network registration
                 try:
-                    creg_response = await self._send_at_command("AT+CREG?", timeout=5)
-                    self.logger.info(f"Network registration response: {creg_response}")
+                    creg_response = await self._send_at_command(self._AT["CREG"], timeout=5)
+                    self.logger.info("Network registration response: %s", creg_response)
                     if "0,1" not in creg_response and "0,5" not in creg_response:
                         self.logger.warning("Network not registered, USSD may fail")
                 except Exception as e:
-                    self.logger.warning(f"Could not check network registration: {e}")
+                    self.logger.warning("Could not check network registration: %s", e)
                 
                 # Reset modem configuration
                 try:
-                    await self._send_at_command("ATZ", timeout=5)  # Reset to default
-                    await self._send_at_command("AT&F", timeout=5)  # Factory reset
+                    await self._send_at_command(self._AT["ATZ"], timeout=5)  # Reset to default
+                    await self._send_at_command(self._AT["ATF"], timeout=5)  # Factory reset
                 except Exception as e:
-                    self.logger.warning(f"Could not reset modem: {e}")
+                    self.logger.warning("Could not reset modem: %s", e)
+                finally:
+                    self._active_charset = None  # A reset restores the default character set
                 
-                # Set character set to IRA (International Reference Alphabet)
+                # Select the character set chosen when the modem was configured
                 try:
-                    await self._send_at_command('AT+CSCS="IRA"', timeout=5)
-                    self.logger.info("Character set set to IRA")
+                    await self._select_charset()
                 except Exception as e:
-                    self.logger.warning(f"Could not set character set to IRA: {e}")
-                    # Try GSM as fallback
-                    try:
-                        await self._send_at_command('AT+CSCS="GSM"', timeout=5)
-                        self.logger.info("Character set set to GSM")
-                    except Exception as e2:
-                        self.logger.warning(f"Could not set character set to GSM: {e2}")
+                    self.logger.warning("Could not set character set to %s: %s", self._charset, e)
                 
                 # Sanitize and encode USSD command
                 sanitized_command = UssdEncoderDecoder.sanitize_for_ussd(command)
-                self.logger.info(f"Sanitized USSD command: {sanitized_command}")
+                self.logger.info("Sanitized USSD command: %s", sanitized_command)
                 
                 # Encode command as GSM 7-bit
                 encoded_command = UssdEncoderDecoder.encode_as_7bit_gsm(sanitized_command)
-                self.logger.info(f"Encoded USSD command: {encoded_command}")
-                
-                # Try multiple USSD sending methods
-                success = False
-                response = None
-                raw_response = None
-                
-                # Method 1: Standard USSD with encoded command
-                try:
-                    self.logger.info("Trying Method 1: Standard USSD with encoded command")
-                    response, raw_response = await self._send_ussd_method1(encoded_command)
-                    if response:
-                        success = True
-                except Exception as e:
-                    self.logger.warning(f"Method 1 failed: {e}")
+                self.logger.info("Encoded USSD command: %s", encoded_command)
                 
-                # Method 2: USSD with hex encoding
-                if not success:
-                    try:
-                        self.logger.info("Trying Method 2: USSD with hex encoding")
-                        response, raw_response = await self._send_ussd_method2(sanitized_command)
-                        if response:
-                            success = True
-                    except Exception as e:
-                        self.logger.warning(f"Method 2 failed: {e}")
-                
-                # Method 3: USSD with different format
-                if not success:
-                    try:
-                        self.logger.info("Trying Method 3: USSD with different format")
-                        response, raw_response = await self._send_ussd_method3(sanitized_command)
-                        if response:
-                            success = True
-                    except Exception as e:
-                        self.logger.warning(f"Method 3 failed: {e}")
-                
-                if not success:
-                    raise UssdException("All USSD sending methods failed")
+                # Try the USSD sending methods in turn
+                methods = (
+                    ("Method 1", functools.partial(self._send_ussd_method1, encoded_command)),
+                    ("Method 2", functools.partial(self._send_ussd_method2, sanitized_command)),
+                    ("Method 3", functools.partial(self._send_ussd_method3, sanitized_command)),
+                )
+                response, raw_response = await self._first_ussd_response(methods)
                 
                 return UssdResponse(
                     command=command,
@@ -903,15 +1636,47 @@ class ModemManager:
                 )
                 
             except Exception as e:
-                self.logger.error(f"Failed to send USSD command {command}: {e}")
+                self.logger.error("Failed to send USSD command %s: %s", command, e)
                 raise UssdException(f"Failed to send USSD command: {e}")
     
+    async def _first_ussd_response(self, methods: Tuple[Tuple[str, Callable[[], Awaitable[Tuple[str, str]]]], ...]) -> Tuple[str, str]:
+        """
+        Try USSD sending methods one after another until one gets a response.
+        
+        Each method opens a USSD session with AT+CUSD, and a second session
+        aborts the first on the modem, so a method only starts once the
+        previous one has failed. Methods return as soon as their +CUSD
+        result arrives, so no time is spent waiting between them.
+        
+        Args:
+            methods: (name, coroutine function) pairs, in order of preference
+            
+        Returns:
+            Tuple of (response, raw response) from the first successful method
+            
+        Raises:
+            UssdException: If every method fails
+        """
+        for name, method in methods:
+            try:
+                self.logger.info("Trying %s", name)
+                response, raw_response = await method()
+                if response:
+                    self.logger.info("USSD response received via %s", name)
+                    return response, raw_response
+            except Exception as e:
+                self.logger.warning("%s failed: %s", name, e)
+        
+        raise UssdException("All USSD sending methods failed")
+    
     async def _send_ussd_method1(self, encoded_command: str) -> Tuple[str, str]:
         """Method 1: Standard USSD with encoded command."""
         ussd_command = f'AT+CUSD=1,"{encoded_command}",15'
-        self.logger.info(f"Sending USSD command: {ussd_command}")
-        response = await self._send_at_command(ussd_command, timeout=30)
-        self.logger.info(f"USSD command response: {response}")
+        self.logger.info("Sending USSD command: %s", ussd_command)
+        response = await self._send_at_command(ussd_command, timeout=8, retries=1, reset_input=False)
+        if "+CUSD:" not in response and "ERROR" not in response:
+            response += await self._await_cusd()
+        self.logger.info("USSD command response: %s", response)
         
         # Parse USSD response
         ussd_response = ""
@@ -922,7 +1687,7 @@ class ModemManager:
         for line in lines:
             if "+CUSD:" in line:
                 # Extract USSD response
-                ussd_match = re.search(r'\+CUSD:\s*\d+,"([^"]*)"', line)
+                ussd_match = _CUSD_RE.search(line)
                 if ussd_match:
                     ussd_response = ussd_match.group(1)
                     break
@@ -939,9 +1704,11 @@ class ModemManager:
         # Convert command to hex
         hex_command = UssdEncoderDecoder.encode_as_hex_7bit_gsm(command)
         ussd_command = f'AT+CUSD=1,"{hex_command}",15'
-        self.logger.info(f"Sending USSD command (hex): {ussd_command}")
-        response = await self._send_at_command(ussd_command, timeout=30)
-        self.logger.info(f"USSD command response: {response}")
+        self.logger.info("Sending USSD command (hex): %s", ussd_command)
+        response = await self._send_at_command(ussd_command, timeout=8, retries=1, reset_input=False)
+        if "+CUSD:" not in response and "ERROR" not in response:
+            response += await self._await_cusd()
+        self.logger.info("USSD command response: %s", response)
         
         # Parse USSD response
         ussd_response = ""
@@ -952,7 +1719,7 @@ class ModemManager:
         for line in lines:
             if "+CUSD:" in line:
                 # Extract USSD response
-                ussd_match = re.search(r'\+CUSD:\s*\d+,"([^"]*)"', line)
+                ussd_match = _CUSD_RE.search(line)
                 if ussd_match:
                     ussd_response = ussd_match.group(1)
                     break
@@ -968,9 +1735,11 @@ class ModemManager:
         """Method 3: USSD with different format."""
         # Try without quotes
         ussd_command = f'AT+CUSD=1,{command},15'
-        self.logger.info(f"Sending USSD command (no quotes): {ussd_command}")
-        response = await self._send_at_command(ussd_command, timeout=30)
-        self.logger.info(f"USSD command response: {response}")
+        self.logger.info("Sending USSD command (no quotes): %s", ussd_command)
+        response = await self._send_at_command(ussd_command, timeout=30, retries=1, reset_input=False)
+        if "+CUSD:" not in response and "ERROR" not in response:
+            response += await self._await_cusd(initial=30)
+        self.logger.info("USSD command response: %s", response)
         
         # Parse USSD response
         ussd_response = ""
@@ -981,7 +1750,7 @@ class ModemManager:
         for line in lines:
             if "+CUSD:" in line:
                 # Extract USSD response
-                ussd_match = re.search(r'\+CUSD:\s*\d+,"([^"]*)"', line)
+                ussd_match = _CUSD_RE.search(line)
                 if ussd_match:
                     ussd_response = ussd_match.group(1)
                     break
@@ -1014,21 +1783,22 @@ class ModemManager:
                         if response.response and "balance" in response.response.lower():
                             return response
                     except Exception as e:
-                        self.logger.debug(f"Balance code {code} failed: {e}")
+                        self.logger.debug("Balance code %s failed: %s", code, e)
                         continue
                 
                 # If no specific balance code works, try the first one
                 return await self.send_ussd(balance_codes[0])
                 
             except Exception as e:
-                self.logger.error(f"Failed to get balance: {e}")
+                self.logger.error("Failed to get balance: %s", e)
                 raise UssdException(f"Failed to get account balance: {e}")
     
     def close(self):
         """Close the modem connection."""
+        self._stop_worker()
         if self.serial_connection and self.serial_connection.is_open:
             self.serial_connection.close()
-            self.logger.info(f"Closed connection to {self.port}")
+            self.logger.info("Closed connection to %s", self.port)
         
         self.is_initialized = False
         self.serial_connection = None
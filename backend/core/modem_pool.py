@@ -0,0 +1,254 @@
+"""
+Modem connection pooling for the Multi-Modem SIM Card Management System.
+
+This module provides the ModemPool class, which keeps one initialized
+ModemManager per serial port so that reconnecting to a modem does not
+reopen the port and rerun the configuration sequence.
+"""
+
+import asyncio
+import serial
+import time
+from contextlib import nullcontext
+from typing import Dict, Optional, Set
+
+from backend.core.modem_manager import ModemManager
+from backend.core.logger import SimManagerLogger, log_operation
+from backend.core.exceptions import MultiModemException
+from backend.config import get_settings
+
+
+class ModemPool:
+    """
+    Pool of initialized modem managers keyed by serial port.
+    
+    Released managers stay connected for MODEM_IDLE_TTL seconds and are
+    handed out again by the next acquire() for the same port if the modem
+    still answers; managers idle for longer are closed. While pooled, the
+    port stays open and cannot be used by other programs.
+    """
+    
+    def __init__(self, settings=None):
+        """
+        Initialize the ModemPool.
+        
+        Args:
+            settings: Application settings object
+        """
+        self.settings = settings or get_settings()
+        self.logger = SimManagerLogger(self.settings)
+        
+        self._managers: Dict[str, ModemManager] = {}
+        self._idle_since: Dict[str, float] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        # Pending eviction of each released port, replaced by every release
+        self._eviction_timers: Dict[str, asyncio.TimerHandle] = {}
+        # Evictions in progress, referenced so they are not garbage collected
+        self._closing: Set[asyncio.Task] = set()
+    
+    async def acquire(self, port: str, connection: Optional[serial.Serial] = None) -> ModemManager:
+        """
+        Get an initialized modem manager for a port.
+        
+        Args:
+            port: Serial port of the modem
+            connection: Already open serial port to use if a new manager is needed;
+                closed if a pooled manager is reused
+        
+        Returns:
+            Connected and configured ModemManager
+        
+        Raises:
+            MultiModemException: If connecting to the modem fails
+        """
+        async with self._lock_for(port):
+            self._idle_since.pop(port, None)
+            self._cancel_eviction(port)
+            
+            modem_manager = await self._checked(port)
+            if modem_manager is not None:
+                self.logger.debug("Reusing pooled modem manager on %s", port)
+                if connection is not None:
+                    connection.close()
+                return modem_manager
+            
+            modem_manager = await self._open(port, connection)
+            self._managers[port] = modem_manager
+            return modem_manager
+    
+    def is_open(self, port: str) -> bool:
+        """
+        Check whether the pool holds an initialized modem manager for a port.
+        
+        Args:
+            port: Serial port of the modem
+        
+        Returns:
+            True if the port is open through a pooled manager
+        """
+        modem_manager = self._managers.get(port)
+        return modem_manager is not None and modem_manager.is_initialized
+    
+    async def check(self, port: str) -> bool:
+        """
+        Check whether the pooled modem manager for a port still answers.
+        
+        A manager that stopped answering (e.g. its modem was unplugged) is
+        closed, freeing the port to be opened again.
+        
+        Args:
+            port: Serial port of the modem
+        
+        Returns:
+            True if the port is open through a working pooled manager
+        """
+        async with self._lock_for(port):
+            return await self._checked(port) is not None
+    
+    def release(self, port: str):
+        """
+        Return a modem manager to the pool.
+        
+        The connection is kept open until it has been idle for the
+        configured TTL.
+        
+        Args:
+            port: Serial port of the modem
+        """
+        if port not in self._managers:
+            return
+        
+        self._idle_since[port] = time.monotonic()
+        ttl = self.settings.MODEM_IDLE_TTL
+        self._cancel_eviction(port)
+        self._eviction_timers[port] = asyncio.get_running_loop().call_later(ttl, self._start_close, port)
+        self.logger.debug("Modem manager on %s released to pool (TTL %ss)", port, ttl)
+    
+    def evict_idle(self):
+        """Close modem managers that have been idle longer than the TTL."""
+        for port in list(self._idle_since):
+            if self._is_expired(port):
+                self._start_close(port)
+    
+    async def close_all(self):
+        """Close every pooled modem manager, concurrently."""
+        managers, self._managers = self._managers, {}
+        self._idle_since.clear()
+        for port in list(self._eviction_timers):
+            self._cancel_eviction(port)
+        
+        results = await asyncio.gather(
+            *(asyncio.to_thread(modem_manager.close) for modem_manager in managers.values()),
+            return_exceptions=True
+        )
+        for port, result in zip(managers, results):
+            if isinstance(result, BaseException):
+                self.logger.warning("Failed to close modem manager on %s: %s", port, result)
+        
+        # Let evictions that were already running finish closing their ports
+        if self._closing:
+            await asyncio.gather(*self._closing, return_exceptions=True)
+    
+    async def _open(self, port: str, connection: Optional[serial.Serial] = None) -> ModemManager:
+        """
+        Connect and configure a new modem manager on a port.
+        
+        Args:
+            port: Serial port to connect to
+            connection: Already open serial port to take over
+        
+        Returns:
+            Initialized ModemManager
+        
+        Raises:
+            MultiModemException: If connection fails
+        """
+        # With structured logging the connect is reported by the caller in one record
+        structured = self.settings.STRUCTURED_LOGGING
+        with nullcontext() if structured else log_operation(self.logger, f"Open pooled modem on {port}"):
+            modem_manager = ModemManager(self.settings)
+            try:
+                # Connect to and configure the modem
+                await modem_manager.initialize(port, connection)
+                
+                if not structured:
+                    self.logger.info("Modem manager connected and configured on %s", port)
+                return modem_manager
+            
+            except Exception as e:
+                self.logger.error("Failed to connect modem manager to %s: %s", port, e)
+                raise MultiModemException(f"Failed to connect modem manager to {port}: {e}", "connect_modem_to_port")
+    
+    def _lock_for(self, port: str) -> asyncio.Lock:
+        """Get the lock serializing opening and closing of one port."""
+        # Per-port lock: opening one modem must not hold up the others
+        lock = self._locks.get(port)
+        if lock is None:
+            lock = self._locks[port] = asyncio.Lock()
+        return lock
+    
+    def _cancel_eviction(self, port: str):
+        """Cancel the pending eviction of a port, if any."""
+        timer = self._eviction_timers.pop(port, None)
+        if timer is not None:
+            timer.cancel()
+    
+    def _start_close(self, port: str):
+        """Start closing the manager on a port in the background."""
+        self._cancel_eviction(port)
+        task = asyncio.create_task(self._close(port))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+    
+    def _is_expired(self, port: str) -> bool:
+        """Check whether the manager on a port has been idle longer than the TTL."""
+        idle_since = self._idle_since.get(port)
+        return idle_since is not None and time.monotonic() - idle_since >= self.settings.MODEM_IDLE_TTL
+    
+    async def _close(self, port: str):
+        """Close and forget the modem manager on a port if it is still idle."""
+        # Holding the port lock makes a concurrent acquire wait for the port to be free
+        async with self._lock_for(port):
+            # Acquired again while waiting for the lock
+            if not self._is_expired(port):
+                return
+            
+            self._idle_since.pop(port, None)
+            modem_manager = self._managers.pop(port, None)
+            if modem_manager is not None:
+                await self._close_manager(port, modem_manager)
+    
+    async def _checked(self, port: str) -> Optional[ModemManager]:
+        """
+        Get the pooled manager for a port if its worker runs and the modem answers AT.
+        
+        A manager failing the check is closed and forgotten. The caller holds
+        the port lock.
+        
+        Args:
+            port: Serial port of the modem
+        
+        Returns:
+            Working pooled ModemManager, or None if there is none
+        """
+        modem_manager = self._managers.get(port)
+        if modem_manager is None:
+            return None
+        
+        if modem_manager.is_initialized and await modem_manager.ping(self.settings.MODEM_PROBE_TIMEOUT):
+            return modem_manager
+        
+        self.logger.warning("Pooled modem manager on %s stopped responding, closing it", port)
+        del self._managers[port]
+        self._idle_since.pop(port, None)
+        self._cancel_eviction(port)
+        await self._close_manager(port, modem_manager)
+        return None
+    
+    async def _close_manager(self, port: str, modem_manager: ModemManager):
+        """Close a modem manager that was removed from the pool."""
+        # Closing joins the worker thread, keep it off the event loop
+        try:
+            await asyncio.to_thread(modem_manager.close)
+        except Exception as e:
+            self.logger.warning("Failed to close modem manager on %s: %s", port, e)
@@ -6,12 +6,21 @@ including detection, connection management, load balancing, and concurrent opera
 """
 
 import asyncio
+import glob
+import json
+import os
+import re
 import serial.tools.list_ports
+import sys
 import time
-from typing import List, Dict, Optional, Any
+from contextlib import nullcontext
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import List, Dict, Optional, Any, Set, Tuple, Callable, Awaitable
 from datetime import datetime
+from types import SimpleNamespace
 
 from backend.core.modem_manager import ModemManager
+from backend.core.modem_pool import ModemPool
 from backend.core.logger import SimManagerLogger, log_operation, log_performance
 from backend.core.exceptions import (
     MultiModemException, ModemLimitExceededException, ModemAlreadyConnectedException,
@@ -23,6 +32,18 @@ from backend.models.models import (
 )
 
 
+# Common Huawei vendor IDs in a pyserial hardware ID ("USB VID:PID=12D1:1506 ...")
+_HUAWEI_HWID_RE = re.compile(r'VID:PID=(?:12D1|19D2|1C9E):', re.I)
+_HUAWEI_DESCRIPTION_RE = re.compile(r'huawei|e3531|e3131|e3372|e5573|e5785', re.I)
+
+# The same vendor IDs as sysfs idVendor values, and where Linux lists USB devices
+_HUAWEI_VIDS = frozenset({"12d1", "19d2", "1c9e"})
+_USB_DEVICES_DIR = "/sys/bus/usb/devices"
+
+# Replies that show a port is an AT command interface
+_PROBE_MARKERS = (b"\r\nOK\r\n", b"+CSQ", b"Manufacturer", b"Model")
+
+
 class MultiModemManager:
     """
     Manages multiple Huawei USB modems concurrently.
@@ -42,13 +63,45 @@ class MultiModemManager:
         self.settings = settings or get_settings()
         self.logger = SimManagerLogger(self.settings)
         
-        # Modem management
+        # Modem management; self.modems keeps connection order (see active_modem_ids)
         self.modems: Dict[str, ModemManager] = {}
-        self.modem_info: Dict[str, ModemInfo] = {}
-        self.active_modem_ids: List[str] = []
+        self.modem_ports: Dict[str, str] = {}
+        
+        # Activity timestamps (time.time()) kept as plain floats; ModemInfo is
+        # built from them only when requested (see get_modem_info)
+        self._connected_at: Dict[str, float] = {}
+        self._last_activity: Dict[str, float] = {}
+        
+        # Initialized modem managers, kept open across disconnect/connect
+        self._pool = ModemPool(self.settings)
+        
+        # Huawei classification per port key; USB metadata of a port never changes
+        self._huawei_ports: Dict[str, bool] = {}
+        
+        # Devices that answered AT probes in this process, probed first next time
+        self._known_huawei_ports: Set[str] = set()
+        
+        # Last detection result: (time.monotonic() stamp, detected modem IDs)
+        self._last_detection: Optional[Tuple[float, List[str]]] = None
+        # Detection currently running and whether it is a fast one
+        self._detection: Optional[Tuple[asyncio.Task, bool]] = None
+        
+        # Ports left open by successful probes, handed to the next connect,
+        # with the timer closing them if no connect claims them in time
+        self._probe_connections: Dict[str, Tuple[serial.Serial, asyncio.TimerHandle]] = {}
+        
+        # Recent status/SIM info results and in-flight queries, keyed by modem ID
+        self._status_cache: Dict[str, Tuple[float, ModemStatus]] = {}
+        self._status_inflight: Dict[str, asyncio.Task] = {}
+        self._sim_info_cache: Dict[str, Tuple[float, SimInfo]] = {}
+        self._sim_info_inflight: Dict[str, asyncio.Task] = {}
         
         # Concurrency control
-        self._lock = asyncio.Lock()
+        # One lock per modem, so a slow connect only blocks operations on that modem
+        self._modem_locks: Dict[str, asyncio.Lock] = {}
+        # One lock per modem serializing its operations (see _exclusive)
+        self._op_locks: Dict[str, asyncio.Lock] = {}
+        self._connecting: Set[str] = set()
         
         # Performance tracking
         self._operation_count = 0
@@ -57,10 +110,50 @@ class MultiModemManager:
         self.logger.info("MultiModemManager initialized")
         self.logger.info(f"Max concurrent modems: {self.settings.MAX_CONCURRENT_MODEMS}")
     
-    async def detect_modems(self) -> List[str]:
+    async def detect_modems(self, fast: bool = False) -> List[str]:
         """
         Detect all available Huawei modems.
         
+        Ports that answered before are probed first. Ports already held by a
+        connected or pooled modem are reported without probing them again.
+        Callers overlapping a running detection share its result instead of
+        scanning the ports again.
+        
+        Args:
+            fast: Stop after the previously known ports if all of them still
+                answer, without probing the other ports
+        
+        Returns:
+            List of detected modem IDs
+            
+        Raises:
+            ModemDetectionException: If detection fails
+        """
+        while self._detection is not None:
+            task, task_fast = self._detection
+            if fast or not task_fast:
+                # Shielded so one caller giving up does not cancel the scan for the others
+                return list(await asyncio.shield(task))
+            # A fast scan may stop early: let it finish, then scan everything
+            await asyncio.wait([task])
+        
+        task = asyncio.ensure_future(self._scan_for_modems(fast))
+        self._detection = (task, fast)
+        
+        def _done(finished: asyncio.Task):
+            if self._detection is not None and self._detection[0] is finished:
+                self._detection = None
+        
+        task.add_done_callback(_done)
+        return list(await asyncio.shield(task))
+    
+    async def _scan_for_modems(self, fast: bool) -> List[str]:
+        """
+        Scan the serial ports for Huawei modems (see detect_modems).
+        
+        Args:
+            fast: Stop after the previously known ports if all of them still answer
+        
         Returns:
             List of detected modem IDs
             
@@ -72,42 +165,104 @@ class MultiModemManager:
                 detected_modems = []
                 
                 # Get all available serial ports
-                ports = list(serial.tools.list_ports.comports())
+                ports = self._list_ports()
                 self.logger.info(f"Found {len(ports)} serial ports")
                 
+                # Probe ports known to answer AT commands first: seen in this
+                # process, then answered last time according to the cache
+                cache = self._load_detection_cache()
+                now = time.time()
+                ports.sort(key=lambda p: (p.device not in self._known_huawei_ports,
+                                          not cache.get(self._port_key(p), {}).get("at", False)))
+                
+                # Ports in use by a connected or pooled modem must not be opened again
+                in_use = {self.modem_ports[modem_id] for modem_id in self.modems}
+                
+                # Pooled ports cannot be probed while open, so ask their managers instead;
+                # a manager that stopped answering is closed and its port probed again
+                pooled = [port.device for port in ports
+                          if port.device not in in_use and self._pool.is_open(port.device)]
+                alive = await asyncio.gather(*(self._pool.check(device) for device in pooled))
+                in_use.update(device for device, responsive in zip(pooled, alive) if responsive)
+                
+                outcomes = []
+                candidates = []
+                huawei_ports = 0
                 for port in ports:
-                    try:
-                        # Check if it's a Huawei modem
-                        if self._is_huawei_modem(port):
-                            modem_id = f"huawei_{port.device}"
-                            
-                            # Test if modem responds to AT commands
-                            if await self._test_at_commands(port.device):
-                                detected_modems.append(modem_id)
-                                self.logger.info(f"Detected Huawei modem: {modem_id} on {port.device}")
-                                
-                                # Store modem information
-                                self.modem_info[modem_id] = ModemInfo(
-                                    modem_id=modem_id,
-                                    port=port.device,
-                                    connected_at=datetime.now(),
-                                    last_activity=datetime.now()
-                                )
-                            else:
-                                self.logger.warning(f"Huawei modem on {port.device} not responsive to AT commands")
-                        else:
-                            self.logger.debug(f"Port {port.device} is not a Huawei modem")
-                            
-                    except Exception as e:
-                        self.logger.warning(f"Error checking port {port.device}: {e}")
+                    # Check if it's a Huawei modem
+                    key = self._port_key(port)
+                    is_huawei = self._huawei_ports.get(key)
+                    if is_huawei is None:
+                        try:
+                            is_huawei = self._huawei_ports[key] = self._is_huawei_modem(port)
+                        except Exception as e:
+                            self.logger.warning(f"Error checking port {port.device}: {e}")
+                            continue
+                    if not is_huawei:
+                        self.logger.debug("Port %s is not a Huawei modem", port.device)
+                        continue
+                    huawei_ports += 1
+                    
+                    # A port still held open by an earlier probe cannot be opened again
+                    if port.device in in_use or port.device in self._probe_connections:
+                        outcomes.append((port, True))
+                        continue
+                    
+                    candidates.append(port)
+                
+                # In fast mode, probe the known ports on their own first
+                rounds = [candidates]
+                if fast:
+                    known = [port for port in candidates if port.device in self._known_huawei_ports]
+                    if known:
+                        rounds = [known, candidates[len(known):]]
                 
+                for round_ports in rounds:
+                    results = await self._probe_ports(round_ports)
+                    for port, result in zip(round_ports, results):
+                        if isinstance(result, BaseException):
+                            self.logger.warning(f"Error checking port {port.device}: {result}")
+                            result = None
+                        if result is not None:
+                            self._keep_probe_connection(port.device, result)
+                        outcomes.append((port, result is not None))
+                    
+                    if fast and all(responsive for _, responsive in outcomes):
+                        break
+                
+                # Record results after all probes finished, in port order
+                order = {port.device: index for index, port in enumerate(ports)}
+                outcomes.sort(key=lambda outcome: order[outcome[0].device])
+                for port, responsive in outcomes:
+                    modem_id = f"huawei_{port.device}"
+                    cache[self._port_key(port)] = {"port": port.device, "at": responsive, "last_seen": now}
+                    if responsive:
+                        self._known_huawei_ports.add(port.device)
+                        detected_modems.append(modem_id)
+                        self.logger.info("Detected Huawei modem: %s on %s", modem_id, port.device)
+                        
+                        # Store modem information; a connected modem keeps its timestamps
+                        self.modem_ports[modem_id] = port.device
+                        if modem_id not in self.modems:
+                            self._connected_at[modem_id] = self._last_activity[modem_id] = now
+                    else:
+                        self._known_huawei_ports.discard(port.device)
+                        self.logger.warning(f"Huawei modem on {port.device} not responsive to AT commands")
+                
+                # Release probe ports of devices that are gone
+                detected_ports = {port.device for port, responsive in outcomes if responsive}
+                for port in set(self._probe_connections) - detected_ports:
+                    self._drop_probe_connection(port)
+                
+                self._save_detection_cache(cache)
+                self._last_detection = (time.monotonic(), detected_modems)
                 self.logger.info(f"Detection completed: {len(detected_modems)} modems found")
                 
                 # Log performance metrics
                 log_performance(self.logger, "modem_detection", 
                     total_ports=len(ports),
                     detected_modems=len(detected_modems),
-                    huawei_modems=len([p for p in ports if self._is_huawei_modem(p)])
+                    huawei_modems=huawei_ports
                 )
                 
                 return detected_modems
@@ -116,6 +271,154 @@ class MultiModemManager:
                 self.logger.error(f"Modem detection failed: {e}")
                 raise ModemDetectionException(f"Failed to detect modems: {e}")
     
+    async def get_detected_modems(self) -> List[str]:
+        """
+        Get the modems found by a recent detection.
+        
+        The last detection result is reused for MODEM_DETECTION_RESULT_TTL
+        seconds; after that the ports are scanned again.
+        
+        Returns:
+            List of detected modem IDs
+            
+        Raises:
+            ModemDetectionException: If detection fails
+        """
+        last = self._last_detection
+        if last is not None and time.monotonic() - last[0] < self.settings.MODEM_DETECTION_RESULT_TTL:
+            return list(last[1])
+        
+        return await self.detect_modems()
+    
+    async def _probe_ports(self, ports: list) -> list:
+        """
+        Probe several ports concurrently.
+        
+        Args:
+            ports: Port objects to probe
+            
+        Returns:
+            Per port, the open serial port, None or the exception raised
+        """
+        if not ports:
+            return []
+        
+        # Probes open independent ports, so run them all at once; the pool
+        # is bounded so a hub full of serial ports cannot spawn a thread each
+        workers = min(len(ports), self.settings.MAX_CONCURRENT_MODEMS)
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="modem-probe")
+        try:
+            return await asyncio.gather(
+                *(self._test_at_commands(port.device, executor) for port in ports),
+                return_exceptions=True
+            )
+        finally:
+            # Do not block the event loop on probe threads that are still running
+            executor.shutdown(wait=False)
+    
+    def _list_ports(self) -> list:
+        """
+        List the serial ports to consider for detection.
+        
+        On Linux the ports of USB devices with a Huawei vendor ID are read
+        straight from sysfs; elsewhere, or when that finds nothing, every port
+        is enumerated through pyserial.
+        
+        Returns:
+            Port objects with device, vid, pid, serial_number, hwid and description
+        """
+        if sys.platform.startswith("linux"):
+            ports = self._fast_huawei_scan()
+            if ports:
+                return ports
+        
+        return list(serial.tools.list_ports.comports())
+    
+    @staticmethod
+    def _fast_huawei_scan() -> List[SimpleNamespace]:
+        """
+        Find the tty ports of Huawei USB devices through sysfs (Linux only).
+        
+        Returns:
+            Minimal port objects, in the shape of pyserial's ListPortInfo
+        """
+        def read_attr(device_dir: str, name: str) -> Optional[str]:
+            try:
+                with open(os.path.join(device_dir, name), encoding="utf-8") as attr_file:
+                    return attr_file.read().strip()
+            except OSError:
+                return None
+        
+        ports = []
+        for vendor_file in glob.glob(os.path.join(_USB_DEVICES_DIR, "*", "idVendor")):
+            device_dir = os.path.dirname(vendor_file)
+            vid = read_attr(device_dir, "idVendor")
+            if not vid or vid.lower() not in _HUAWEI_VIDS:
+                continue
+            pid = read_attr(device_dir, "idProduct") or "0"
+            serial_number = read_attr(device_dir, "serial")
+            product = read_attr(device_dir, "product") or "USB modem"
+            
+            # usb-serial interfaces hold ttyUSBn directly, cdc-acm ones under tty/
+            tty_paths = (glob.glob(os.path.join(device_dir, "*:*", "ttyUSB*"))
+                         + glob.glob(os.path.join(device_dir, "*:*", "tty", "tty*")))
+            for tty_path in sorted(tty_paths):
+                name = os.path.basename(tty_path)
+                hwid = f"USB VID:PID={vid.upper()}:{pid.upper()}"
+                if serial_number:
+                    hwid += f" SER={serial_number}"
+                ports.append(SimpleNamespace(
+                    device=f"/dev/{name}",
+                    vid=int(vid, 16),
+                    pid=int(pid, 16),
+                    serial_number=serial_number,
+                    hwid=hwid,
+                    description=f"{product} ({name})"
+                ))
+        
+        return ports
+    
+    @staticmethod
+    def _port_key(port) -> str:
+        """Build the detection cache key (VID:PID:serial number:device) for a port."""
+        return f"{port.vid or 0:04x}:{port.pid or 0:04x}:{port.serial_number or ''}:{port.device}"
+    
+    def _load_detection_cache(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Load the persistent detection cache.
+        
+        Returns:
+            Mapping of port keys to {"port", "at", "last_seen"} entries
+        """
+        if not self.settings.MODEM_DETECTION_CACHE_FILE:
+            return {}
+        
+        path = os.path.expanduser(self.settings.MODEM_DETECTION_CACHE_FILE)
+        try:
+            with open(path, encoding="utf-8") as cache_file:
+                cache = json.load(cache_file)
+            return cache if isinstance(cache, dict) else {}
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_detection_cache(self, cache: Dict[str, Dict[str, Any]]):
+        """
+        Persist the detection cache.
+        
+        Args:
+            cache: Mapping of port keys to detection results
+        """
+        if not self.settings.MODEM_DETECTION_CACHE_FILE:
+            return
+        
+        path = os.path.expanduser(self.settings.MODEM_DETECTION_CACHE_FILE)
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(path, "w", encoding="utf-8") as cache_file:
+                json.dump(cache, cache_file, indent=2)
+        except OSError as e:
+            self.logger.warning(f"Could not save modem detection cache to {path}: {e}")
+    
     def _is_huawei_modem(self, port) -> bool:
         """
         Check if a port is a Huawei modem.
@@ -126,84 +429,155 @@ class MultiModemManager:
         Returns:
             True if it's a Huawei modem
         """
-        # Check vendor ID and product ID for Huawei
-        huawei_vids = [0x12d1, 0x19d2, 0x1c9e]  # Common Huawei vendor IDs
-        
-        if hasattr(port, 'vid') and port.vid in huawei_vids:
-            return True
-        
-        # Check description for Huawei keywords
-        if hasattr(port, 'description'):
-            description = port.description.lower()
-            huawei_keywords = ['huawei', 'e3531', 'e3131', 'e3372', 'e5573', 'e5785']
-            return any(keyword in description for keyword in huawei_keywords)
-        
-        return False
+        # Check the vendor ID in the hardware ID, then the description for Huawei keywords
+        return bool(
+            _HUAWEI_HWID_RE.search(port.hwid or "")
+            or _HUAWEI_DESCRIPTION_RE.search(port.description or "")
+        )
     
-    async def _test_at_commands(self, port: str) -> bool:
+    async def _test_at_commands(self, port: str, executor: Optional[Executor] = None) -> Optional[serial.Serial]:
         """
         Test if a port responds to AT commands.
         
         Args:
             port: Serial port to test
+            executor: Executor to run the probe on (default executor if None)
             
         Returns:
-            True if port responds to AT commands
+            The open serial port if it responds to AT commands, otherwise None
         """
+        # The probe uses blocking reads, keep them off the event loop
+        loop = asyncio.get_running_loop()
+        probe = loop.run_in_executor(executor, self._probe_port, port)
         try:
-            # Create temporary connection to test AT commands
-            with serial.Serial(
-                port=port,
-                baudrate=self.settings.MODEM_BAUDRATE,
-                timeout=1,
-                bytesize=serial.EIGHTBITS,
-                parity=serial.PARITY_NONE,
-                stopbits=serial.STOPBITS_ONE
-            ) as test_connection:
-                # Some devices require DTR/RTS asserted
-                try:
-                    test_connection.dtr = True
-                    test_connection.rts = True
-                except Exception:
-                    pass
-                # Flush any stale data
+            # Shielded so a probe thread finishing after cancellation still hands its port back
+            return await asyncio.shield(probe)
+        except asyncio.CancelledError:
+            probe.add_done_callback(self._close_abandoned_probe)
+            raise
+        except Exception as e:
+            self.logger.debug(f"AT command test failed for {port}: {e}")
+            return None
+    
+    def _probe_port(self, port: str) -> Optional[serial.Serial]:
+        """
+        Send probe commands to a port and wait for a reply (blocking).
+        
+        A port that answers is left open so connect_modem can take it over
+        instead of opening it again.
+        
+        Args:
+            port: Serial port to test
+            
+        Returns:
+            The open serial port if it responds to AT commands, otherwise None
+        """
+        # Create temporary connection to test AT commands
+        test_connection = serial.Serial(
+            port=port,
+            baudrate=self.settings.MODEM_BAUDRATE,
+            timeout=self.settings.MODEM_PROBE_TIMEOUT,
+            bytesize=serial.EIGHTBITS,
+            parity=serial.PARITY_NONE,
+            stopbits=serial.STOPBITS_ONE
+        )
+        responsive = False
+        try:
+            # Some devices require DTR/RTS asserted
+            try:
+                test_connection.dtr = True
+                test_connection.rts = True
+            except Exception:
+                pass
+            # Flush any stale data
+            try:
+                test_connection.reset_input_buffer()
+                test_connection.reset_output_buffer()
+            except Exception:
+                pass
+            # Deliver received bytes immediately instead of on the driver's poll tick
+            try:
+                test_connection.set_low_latency_mode(True)
+            except (AttributeError, NotImplementedError, OSError, ValueError):
+                pass
+
+            buffer = bytearray()
+
+            # A modem answers AT right away; ATI is only a second chance for a
+            # port that stayed silent (e.g. it swallowed the first command)
+            for cmd in (b"AT\r\n", b"ATI\r\n"):
                 try:
-                    test_connection.reset_input_buffer()
-                    test_connection.reset_output_buffer()
+                    test_connection.write(cmd)
+                    # Returns as soon as OK arrives, or after the probe timeout
+                    buffer += test_connection.read_until(b"OK\r\n", 256)
                 except Exception:
-                    pass
+                    continue
 
-                # Try a short sequence of probe commands
-                probe_commands = [b"AT\r\n", b"ATZ\r\n", b"ATI\r\n"]
-                for cmd in probe_commands:
-                    try:
-                        test_connection.write(cmd)
-                    except Exception:
-                        continue
+                # Match framed result codes on the raw bytes; a bare "OK" can appear in banners
+                if any(marker in buffer for marker in _PROBE_MARKERS):
+                    responsive = True
+                    return test_connection
 
-                    # Read for up to 2 seconds looking for OK or typical ID lines
-                    deadline = time.monotonic() + 2.0
-                    buffer = ""
-                    while time.monotonic() < deadline:
-                        try:
-                            if test_connection.in_waiting:
-                                line = test_connection.readline().decode('utf-8', errors='ignore').strip()
-                                if not line:
-                                    await asyncio.sleep(0.05)
-                                    continue
-                                buffer += line + "\n"
-                                if "OK" in line or "+CSQ" in line or "Manufacturer" in line or "Model" in line:
-                                    return True
-                        except Exception:
-                            # Keep probing within the deadline
-                            await asyncio.sleep(0.05)
-                            continue
-                        await asyncio.sleep(0.05)
-                # As a last check, consider any buffered OK
-                return "OK" in buffer
-        except Exception as e:
-            self.logger.debug(f"AT command test failed for {port}: {e}")
-            return False
+                # Something answered, but not with a result code: not an AT port
+                if buffer:
+                    break
+
+            return None
+        finally:
+            if not responsive:
+                test_connection.close()
+    
+    @staticmethod
+    def _close_abandoned_probe(probe: asyncio.Future):
+        """Close the port opened by a probe whose detection was cancelled."""
+        if not probe.cancelled() and probe.exception() is None and probe.result() is not None:
+            probe.result().close()
+    
+    def _keep_probe_connection(self, port: str, connection: serial.Serial):
+        """
+        Hold on to the open port of a successful probe until the modem is connected.
+        
+        Serial ports are exclusive on some platforms, so a port that is not
+        claimed within MODEM_PROBE_CONNECTION_TTL seconds is closed again.
+        
+        Args:
+            port: Serial port that was probed
+            connection: Open serial port returned by the probe
+        """
+        self._drop_probe_connection(port)
+        expiry = asyncio.get_running_loop().call_later(
+            self.settings.MODEM_PROBE_CONNECTION_TTL, self._drop_probe_connection, port
+        )
+        self._probe_connections[port] = (connection, expiry)
+    
+    def _take_probe_connection(self, port: str) -> Optional[serial.Serial]:
+        """
+        Claim the port left open by a probe, if any.
+        
+        Args:
+            port: Serial port to claim
+            
+        Returns:
+            The open serial port, or None if there is none
+        """
+        kept = self._probe_connections.pop(port, None)
+        if kept is None:
+            return None
+        connection, expiry = kept
+        expiry.cancel()
+        return connection
+    
+    def _drop_probe_connection(self, port: str):
+        """Close the port left open by a probe, if it was not claimed."""
+        connection = self._take_probe_connection(port)
+        if connection is not None:
+            self.logger.debug("Closing unclaimed probe port %s", port)
+            connection.close()
+    
+    def _close_probe_connections(self):
+        """Close probe ports that were never taken over by a connection."""
+        for port in list(self._probe_connections):
+            self._drop_probe_connection(port)
     
     async def connect_modem(self, modem_id: str) -> bool:
         """
@@ -220,37 +594,50 @@ class MultiModemManager:
             ModemAlreadyConnectedException: If modem is already connected
             ModemNotFoundException: If modem not found
         """
-        async with self._lock:
-            with log_operation(self.logger, f"Connect modem {modem_id}"):
+        structured = self.settings.STRUCTURED_LOGGING
+        async with self._lock_for(modem_id):
+            with nullcontext() if structured else log_operation(self.logger, f"Connect modem {modem_id}"):
                 try:
                     # Check if modem is already connected
                     if modem_id in self.modems:
                         raise ModemAlreadyConnectedException(f"Modem {modem_id} is already connected")
                     
-                    # Check if we've reached the maximum number of modems
-                    if len(self.modems) >= self.settings.MAX_CONCURRENT_MODEMS:
+                    # Check if we've reached the maximum number of modems, counting
+                    # connects to other modems that are still in progress
+                    if len(self.modems) + len(self._connecting) >= self.settings.MAX_CONCURRENT_MODEMS:
                         raise ModemLimitExceededException(
                             f"Maximum number of modems ({self.settings.MAX_CONCURRENT_MODEMS}) reached"
                         )
                     
                     # Check if modem info exists
-                    if modem_id not in self.modem_info:
+                    port = self.modem_ports.get(modem_id)
+                    if port is None:
                         raise ModemNotFoundException(modem_id)
                     
-                    # Extract port from modem ID
-                    port = self.modem_info[modem_id].port
-                    
-                    # Create and connect modem manager
-                    modem_manager = ModemManager(self.settings)
-                    await self._connect_modem_to_port(modem_manager, port)
+                    # Get a connected modem manager, reusing a pooled one if possible
+                    self._connecting.add(modem_id)
+                    started = time.perf_counter()
+                    try:
+                        modem_manager = await self._pool.acquire(port, self._take_probe_connection(port))
+                    finally:
+                        self._connecting.discard(modem_id)
+                    connect_ms = (time.perf_counter() - started) * 1000
                     
                     # Store the connected modem
                     self.modems[modem_id] = modem_manager
-                    self.active_modem_ids.append(modem_id)
                     
                     # Update modem info
-                    self.modem_info[modem_id].connected_at = datetime.now()
-                    self.modem_info[modem_id].last_activity = datetime.now()
+                    self._connected_at[modem_id] = self._last_activity[modem_id] = time.time()
+                    
+                    if structured:
+                        # One record with every field instead of the step-by-step messages
+                        context = {"modem_id": modem_id, "port": port, "connect_ms": round(connect_ms, 1),
+                                   "total_connected": len(self.modems)}
+                        self.logger.info(
+                            "modem_connected modem_id=%s port=%s connect_ms=%.1f total_connected=%d",
+                            modem_id, port, connect_ms, len(self.modems), extra={'context': context}
+                        )
+                        return True
                     
                     self.logger.info(f"Successfully connected to modem {modem_id} on {port}")
                     
@@ -258,6 +645,7 @@ class MultiModemManager:
                     log_performance(self.logger, "modem_connection", 
                         modem_id=modem_id,
                         port=port,
+                        connect_ms=round(connect_ms, 1),
                         total_connected=len(self.modems)
                     )
                     
@@ -269,38 +657,52 @@ class MultiModemManager:
                     self.logger.error(f"Failed to connect to modem {modem_id}: {e}")
                     raise MultiModemException(f"Failed to connect to modem {modem_id}: {e}", "connect_modem")
     
-    async def _connect_modem_to_port(self, modem_manager: ModemManager, port: str):
+    async def detect_and_connect_all(self) -> Tuple[List[str], List[str]]:
         """
-        Connect a modem manager to a specific port.
+        Detect modems and connect to all of them at once.
         
-        Args:
-            modem_manager: ModemManager instance
-            port: Serial port to connect to
+        Connections are opened concurrently, up to the free modem slots;
+        modems that are already connected are left as they are.
+        
+        Returns:
+            Tuple of the modem IDs found by this detection and the modem IDs
+            connected by this call
             
         Raises:
-            MultiModemException: If connection fails
+            ModemDetectionException: If detection fails
         """
-        try:
-            # Connect to the port
-            await modem_manager._connect_to_modem(port)
+        with log_operation(self.logger, "Detect and connect all modems"):
+            found = await self.detect_modems()
+            detected = [modem_id for modem_id in found if modem_id not in self.modems]
+            free_slots = max(self.settings.MAX_CONCURRENT_MODEMS - len(self.modems) - len(self._connecting), 0)
+            modem_ids = detected[:free_slots]
             
-            # Configure the modem
-            await modem_manager._configure_modem()
+            results = await asyncio.gather(
+                *(self.connect_modem(modem_id) for modem_id in modem_ids),
+                return_exceptions=True
+            )
             
-            # Mark as initialized
-            modem_manager.is_initialized = True
-            modem_manager.port = port
+            connected = []
+            for modem_id, result in zip(modem_ids, results):
+                if result is True:
+                    connected.append(modem_id)
+                elif isinstance(result, BaseException):
+                    self.logger.warning(f"Failed to connect modem {modem_id}: {result}")
             
-            self.logger.info(f"Modem manager connected and configured on {port}")
+            # Modems left over for lack of free slots do not keep their probe ports open
+            for modem_id in detected[free_slots:]:
+                self._drop_probe_connection(self.modem_ports[modem_id])
             
-        except Exception as e:
-            self.logger.error(f"Failed to connect modem manager to {port}: {e}")
-            raise MultiModemException(f"Failed to connect modem manager to {port}: {e}", "connect_modem_to_port")
+            self.logger.info(f"Connected {len(connected)} of {len(detected)} detected modems")
+            return found, connected
     
     async def disconnect_modem(self, modem_id: str) -> bool:
         """
         Disconnect from a specific modem.
         
+        The modem is returned to the pool, so its port stays open for
+        MODEM_IDLE_TTL seconds in case it is connected again.
+        
         Args:
             modem_id: Modem identifier to disconnect from
             
@@ -310,25 +712,10 @@ class MultiModemManager:
         Raises:
             ModemNotFoundException: If modem not found
         """
-        async with self._lock:
+        async with self._lock_for(modem_id):
             with log_operation(self.logger, f"Disconnect modem {modem_id}"):
                 try:
-                    # Check if modem is connected
-                    if modem_id not in self.modems:
-                        raise ModemNotFoundException(modem_id)
-                    
-                    # Close the modem connection
-                    modem_manager = self.modems[modem_id]
-                    modem_manager.close()
-                    
-                    # Remove from active modems
-                    del self.modems[modem_id]
-                    if modem_id in self.active_modem_ids:
-                        self.active_modem_ids.remove(modem_id)
-                    
-                    # Update modem info
-                    if modem_id in self.modem_info:
-                        self.modem_info[modem_id].last_activity = datetime.now()
+                    self._disconnect_unlocked(modem_id)
                     
                     self.logger.info(f"Successfully disconnected from modem {modem_id}")
                     
@@ -346,6 +733,48 @@ class MultiModemManager:
                     self.logger.error(f"Failed to disconnect from modem {modem_id}: {e}")
                     raise MultiModemException(f"Failed to disconnect from modem {modem_id}: {e}", "disconnect_modem")
     
+    @property
+    def active_modem_ids(self) -> List[str]:
+        """IDs of the connected modems, in connection order."""
+        return list(self.modems)
+    
+    def _lock_for(self, modem_id: str) -> asyncio.Lock:
+        """Get the lock serializing connect/disconnect of one modem."""
+        lock = self._modem_locks.get(modem_id)
+        if lock is None:
+            lock = self._modem_locks[modem_id] = asyncio.Lock()
+        return lock
+    
+    def _disconnect_unlocked(self, modem_id: str):
+        """
+        Remove a connected modem and return its manager to the pool.
+        
+        Runs without awaiting, so the registry update cannot interleave with
+        other coroutines; the caller holds the modem's lock when needed.
+        
+        Args:
+            modem_id: Modem identifier to disconnect from
+            
+        Raises:
+            ModemNotFoundException: If modem not connected
+        """
+        # Check if modem is connected
+        modem_manager = self.modems.pop(modem_id, None)
+        if modem_manager is None:
+            raise ModemNotFoundException(modem_id)
+        
+        # Return the modem to the pool; it is closed once idle for the TTL
+        self._pool.release(modem_manager.port)
+        
+        # Update modem info
+        self._touch(modem_id)
+        
+        # Results of a disconnected modem must not be served to the next connection
+        self._status_cache.pop(modem_id, None)
+        self._sim_info_cache.pop(modem_id, None)
+        self._status_inflight.pop(modem_id, None)
+        self._sim_info_inflight.pop(modem_id, None)
+    
     async def get_all_modems_status(self) -> MultiModemStatus:
         """
         Get status of all modems.
@@ -357,29 +786,38 @@ class MultiModemManager:
             try:
                 statuses = {}
                 
-                for modem_id, modem_manager in self.modems.items():
-                    try:
-                        status = await modem_manager.get_status()
-                        statuses[modem_id] = status
-                        
-                        # Update last activity
-                        if modem_id in self.modem_info:
-                            self.modem_info[modem_id].last_activity = datetime.now()
-                            
-                    except Exception as e:
-                        self.logger.warning(f"Failed to get status for modem {modem_id}: {e}")
+                # Each modem has its own serial worker, so query them all at once
+                modem_ids = list(self.modems)
+                results = await asyncio.gather(
+                    *(self._single_flight(
+                        self._status_cache, self._status_inflight, modem_id,
+                        self.settings.MODEM_STATUS_CACHE_TTL, self.modems[modem_id].get_status
+                    ) for modem_id in modem_ids),
+                    return_exceptions=True
+                )
+                
+                now = time.time()
+                for modem_id, result in zip(modem_ids, results):
+                    if isinstance(result, BaseException):
+                        self.logger.warning(f"Failed to get status for modem {modem_id}: {result}")
                         # Return error status
                         statuses[modem_id] = ModemStatus(
                             connected=False,
                             modem_id=modem_id,
-                            error=str(e)
+                            error=str(result)
                         )
+                        continue
+                    
+                    statuses[modem_id] = result
+                    
+                    # Update last activity
+                    self._last_activity[modem_id] = now
                 
-                self.logger.info(f"Retrieved status for {len(statuses)} modems")
+                self.logger.info("Retrieved status for %d modems", len(statuses))
                 
                 # Create MultiModemStatus object
                 return MultiModemStatus(
-                    total_modems=len(self.modem_info),
+                    total_modems=len(self.modem_ports),
                     connected_modems=len(self.modems),
                     modems=statuses
                 )
@@ -388,6 +826,97 @@ class MultiModemManager:
                 self.logger.error(f"Failed to get all modems status: {e}")
                 raise MultiModemException(f"Failed to get all modems status: {e}", "get_all_modems_status")
     
+    async def _ensure_connected(self, modem_id: str) -> ModemManager:
+        """
+        Get the manager of a modem, connecting it first if needed.
+        
+        Args:
+            modem_id: Modem identifier
+            
+        Returns:
+            Connected ModemManager
+            
+        Raises:
+            ModemNotFoundException: If the modem could not be connected
+        """
+        modem_manager = self.modems.get(modem_id)
+        if modem_manager is not None:
+            return modem_manager
+        
+        self.logger.info(f"Modem {modem_id} not connected, attempting to connect...")
+        try:
+            await self.connect_modem(modem_id)
+            self.logger.info(f"Successfully connected to modem {modem_id}")
+        except Exception as e:
+            self.logger.error(f"Failed to connect to modem {modem_id}: {e}")
+            raise ModemNotFoundException(f"Modem {modem_id} not found or could not be connected")
+        
+        return self.modems[modem_id]
+    
+    async def _single_flight(self, cache: Dict[str, Tuple[float, Any]], inflight: Dict[str, asyncio.Task],
+                             modem_id: str, ttl: float, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run a modem query, sharing recent and in-flight results between callers.
+        
+        Args:
+            cache: Mapping of modem ID to (time.monotonic() stamp, result)
+            inflight: Mapping of modem ID to the query currently running
+            modem_id: Modem identifier
+            ttl: Seconds a cached result stays valid
+            fetch: Coroutine function performing the query
+            
+        Returns:
+            Cached, shared or fresh query result
+        """
+        entry = cache.get(modem_id)
+        if entry is not None and time.monotonic() - entry[0] < ttl:
+            return entry[1]
+        
+        task = inflight.get(modem_id)
+        if task is None:
+            task = asyncio.ensure_future(self._exclusive(modem_id, fetch))
+            inflight[modem_id] = task
+            
+            def _done(finished: asyncio.Task):
+                # A query dropped by a disconnect must not cache its result
+                if inflight.get(modem_id) is not finished:
+                    return
+                inflight.pop(modem_id)
+                if not finished.cancelled() and finished.exception() is None:
+                    cache[modem_id] = (time.monotonic(), finished.result())
+            
+            task.add_done_callback(_done)
+        
+        # Shielded so one caller giving up does not cancel the query for the others
+        return await asyncio.shield(task)
+    
+    async def _exclusive(self, modem_id: str, operation: Callable[..., Awaitable[Any]], *args) -> Any:
+        """
+        Run a modem operation without overlapping other operations on that modem.
+        
+        Operations such as sending an SMS span several AT commands (AT+CMGS,
+        then the text after the prompt) that a concurrent command must not
+        split. Different modems still run in parallel.
+        
+        Args:
+            modem_id: Modem identifier
+            operation: Coroutine function of the modem manager
+            *args: Arguments for the operation
+            
+        Returns:
+            Result of the operation
+        """
+        lock = self._op_locks.get(modem_id)
+        if lock is None:
+            lock = self._op_locks[modem_id] = asyncio.Lock()
+        
+        async with lock:
+            return await operation(*args)
+    
+    def _touch(self, modem_id: str):
+        """Record activity on a modem."""
+        self._last_activity[modem_id] = time.time()
+    
     async def get_modem_status(self, modem_id: str) -> ModemStatus:
         """
         Get status of a specific modem.
@@ -403,22 +932,12 @@ class MultiModemManager:
         """
         with log_operation(self.logger, f"Get modem status {modem_id}"):
             try:
-                # Check if modem is connected, if not, try to connect it
-                if modem_id not in self.modems:
-                    self.logger.info(f"Modem {modem_id} not connected, attempting to connect...")
-                    try:
-                        await self.connect_modem(modem_id)
-                        self.logger.info(f"Successfully connected to modem {modem_id}")
-                    except Exception as e:
-                        self.logger.error(f"Failed to connect to modem {modem_id}: {e}")
-                        raise ModemNotFoundException(f"Modem {modem_id} not found or could not be connected")
-                
-                modem_manager = self.modems[modem_id]
-                status = await modem_manager.get_status()
-                
-                # Update last activity
-                if modem_id in self.modem_info:
-                    self.modem_info[modem_id].last_activity = datetime.now()
+                modem_manager = await self._ensure_connected(modem_id)
+                status = await self._single_flight(
+                    self._status_cache, self._status_inflight, modem_id,
+                    self.settings.MODEM_STATUS_CACHE_TTL, modem_manager.get_status
+                )
+                self._touch(modem_id)
                 
                 return status
                 
@@ -443,22 +962,12 @@ class MultiModemManager:
         """
         with log_operation(self.logger, f"Get SIM info {modem_id}"):
             try:
-                # Check if modem is connected, if not, try to connect it
-                if modem_id not in self.modems:
-                    self.logger.info(f"Modem {modem_id} not connected, attempting to connect...")
-                    try:
-                        await self.connect_modem(modem_id)
-                        self.logger.info(f"Successfully connected to modem {modem_id}")
-                    except Exception as e:
-                        self.logger.error(f"Failed to connect to modem {modem_id}: {e}")
-                        raise ModemNotFoundException(f"Modem {modem_id} not found or could not be connected")
-                
-                modem_manager = self.modems[modem_id]
-                sim_info = await modem_manager.get_sim_info()
-                
-                # Update last activity
-                if modem_id in self.modem_info:
-                    self.modem_info[modem_id].last_activity = datetime.now()
+                modem_manager = await self._ensure_connected(modem_id)
+                sim_info = await self._single_flight(
+                    self._sim_info_cache, self._sim_info_inflight, modem_id,
+                    self.settings.MODEM_SIM_INFO_CACHE_TTL, modem_manager.get_sim_info
+                )
+                self._touch(modem_id)
                 
                 return sim_info
                 
@@ -483,22 +992,9 @@ class MultiModemManager:
         """
         with log_operation(self.logger, f"Get SMS {modem_id}"):
             try:
-                # Check if modem is connected, if not, try to connect it
-                if modem_id not in self.modems:
-                    self.logger.info(f"Modem {modem_id} not connected, attempting to connect...")
-                    try:
-                        await self.connect_modem(modem_id)
-                        self.logger.info(f"Successfully connected to modem {modem_id}")
-                    except Exception as e:
-                        self.logger.error(f"Failed to connect to modem {modem_id}: {e}")
-                        raise ModemNotFoundException(f"Modem {modem_id} not found or could not be connected")
-                
-                modem_manager = self.modems[modem_id]
-                messages = await modem_manager.get_sms_messages()
-                
-                # Update last activity
-                if modem_id in self.modem_info:
-                    self.modem_info[modem_id].last_activity = datetime.now()
+                modem_manager = await self._ensure_connected(modem_id)
+                messages = await self._exclusive(modem_id, modem_manager.get_sms_messages)
+                self._touch(modem_id)
                 
                 return messages
                 
@@ -525,22 +1021,9 @@ class MultiModemManager:
         """
         with log_operation(self.logger, f"Send SMS {modem_id} to {number}"):
             try:
-                # Check if modem is connected, if not, try to connect it
-                if modem_id not in self.modems:
-                    self.logger.info(f"Modem {modem_id} not connected, attempting to connect...")
-                    try:
-                        await self.connect_modem(modem_id)
-                        self.logger.info(f"Successfully connected to modem {modem_id}")
-                    except Exception as e:
-                        self.logger.error(f"Failed to connect to modem {modem_id}: {e}")
-                        raise ModemNotFoundException(f"Modem {modem_id} not found or could not be connected")
-                
-                modem_manager = self.modems[modem_id]
-                success = await modem_manager.send_sms(number, message)
-                
-                # Update last activity
-                if modem_id in self.modem_info:
-                    self.modem_info[modem_id].last_activity = datetime.now()
+                modem_manager = await self._ensure_connected(modem_id)
+                success = await self._exclusive(modem_id, modem_manager.send_sms, number, message)
+                self._touch(modem_id)
                 
                 return success
                 
@@ -566,22 +1049,9 @@ class MultiModemManager:
         """
         with log_operation(self.logger, f"Delete SMS {message_id} from {modem_id}"):
             try:
-                # Check if modem is connected, if not, try to connect it
-                if modem_id not in self.modems:
-                    self.logger.info(f"Modem {modem_id} not connected, attempting to connect...")
-                    try:
-                        await self.connect_modem(modem_id)
-                        self.logger.info(f"Successfully connected to modem {modem_id}")
-                    except Exception as e:
-                        self.logger.error(f"Failed to connect to modem {modem_id}: {e}")
-                        raise ModemNotFoundException(f"Modem {modem_id} not found or could not be connected")
-                
-                modem_manager = self.modems[modem_id]
-                success = await modem_manager.delete_sms(message_id)
-                
-                # Update last activity
-                if modem_id in self.modem_info:
-                    self.modem_info[modem_id].last_activity = datetime.now()
+                modem_manager = await self._ensure_connected(modem_id)
+                success = await self._exclusive(modem_id, modem_manager.delete_sms, message_id)
+                self._touch(modem_id)
                 
                 return success
                 
@@ -607,22 +1077,9 @@ class MultiModemManager:
         """
         with log_operation(self.logger, f"Send USSD {command} from {modem_id}"):
             try:
-                # Check if modem is connected, if not, try to connect it
-                if modem_id not in self.modems:
-                    self.logger.info(f"Modem {modem_id} not connected, attempting to connect...")
-                    try:
-                        await self.connect_modem(modem_id)
-                        self.logger.info(f"Successfully connected to modem {modem_id}")
-                    except Exception as e:
-                        self.logger.error(f"Failed to connect to modem {modem_id}: {e}")
-                        raise ModemNotFoundException(f"Modem {modem_id} not found or could not be connected")
-                
-                modem_manager = self.modems[modem_id]
-                response = await modem_manager.send_ussd(command)
-                
-                # Update last activity
-                if modem_id in self.modem_info:
-                    self.modem_info[modem_id].last_activity = datetime.now()
+                modem_manager = await self._ensure_connected(modem_id)
+                response = await self._exclusive(modem_id, modem_manager.send_ussd, command)
+                self._touch(modem_id)
                 
                 return response
                 
@@ -647,22 +1104,9 @@ class MultiModemManager:
         """
         with log_operation(self.logger, f"Get balance {modem_id}"):
             try:
-                # Check if modem is connected, if not, try to connect it
-                if modem_id not in self.modems:
-                    self.logger.info(f"Modem {modem_id} not connected, attempting to connect...")
-                    try:
-                        await self.connect_modem(modem_id)
-                        self.logger.info(f"Successfully connected to modem {modem_id}")
-                    except Exception as e:
-                        self.logger.error(f"Failed to connect to modem {modem_id}: {e}")
-                        raise ModemNotFoundException(f"Modem {modem_id} not found or could not be connected")
-                
-                modem_manager = self.modems[modem_id]
-                response = await modem_manager.get_balance()
-                
-                # Update last activity
-                if modem_id in self.modem_info:
-                    self.modem_info[modem_id].last_activity = datetime.now()
+                modem_manager = await self._ensure_connected(modem_id)
+                response = await self._exclusive(modem_id, modem_manager.get_balance)
+                self._touch(modem_id)
                 
                 return response
                 
@@ -681,6 +1125,20 @@ class MultiModemManager:
         """
         return list(self.modems.keys())
     
+    @property
+    def connected_modem_count(self) -> int:
+        """Number of currently connected modems."""
+        return len(self.modems)
+    
+    def get_first_connected_modem(self) -> Optional[str]:
+        """
+        Get the ID of the modem connected first.
+        
+        Returns:
+            Modem ID, or None if no modem is connected
+        """
+        return next(iter(self.modems), None)
+    
     def get_modem_info(self, modem_id: str) -> Optional[ModemInfo]:
         """
         Get additional information about a modem.
@@ -691,7 +1149,16 @@ class MultiModemManager:
         Returns:
             ModemInfo object or None if not found
         """
-        return self.modem_info.get(modem_id)
+        port = self.modem_ports.get(modem_id)
+        if port is None:
+            return None
+        
+        return ModemInfo(
+            modem_id=modem_id,
+            port=port,
+            connected_at=datetime.fromtimestamp(self._connected_at[modem_id]),
+            last_activity=datetime.fromtimestamp(self._last_activity[modem_id])
+        )
     
     async def cleanup(self):
         """Clean up all modem connections."""
@@ -699,10 +1166,14 @@ class MultiModemManager:
             try:
                 for modem_id in list(self.modems.keys()):
                     try:
-                        await self.disconnect_modem(modem_id)
+                        self._disconnect_unlocked(modem_id)
                     except Exception as e:
                         self.logger.warning(f"Failed to disconnect modem {modem_id} during cleanup: {e}")
                 
+                # Close the modems in parallel; each close waits for its serial worker
+                await self._pool.close_all()
+                self._close_probe_connections()
+                
                 self.logger.info("All modem connections cleaned up")
                 
             except Exception as e:
@@ -716,7 +1187,7 @@ class MultiModemManager:
             Dictionary with performance metrics
         """
         return {
-            "total_modems": len(self.modem_info),
+            "total_modems": len(self.modem_ports),
             "connected_modems": len(self.modems),
             "active_modem_ids": self.active_modem_ids,
             "operation_count": self._operation_count,
@@ -5,7 +5,15 @@ This module provides the OperatorManager class for managing mobile operator
 profiles, USSD codes, and operator-specific configurations.
 """
 
-from typing import Dict, List, Optional, Any
+import functools
+import json
+import logging
+import os
+import re
+import sys
+from collections import Counter
+from contextlib import nullcontext
+from typing import Dict, List, Optional, Any, Tuple, Mapping
 from datetime import datetime
 
 from backend.core.logger import SimManagerLogger, log_operation, log_performance
@@ -16,6 +24,76 @@ from backend.config import get_settings
 from backend.models.models import OperatorProfile, NetworkType
 
 
+# Built-in operator profiles, keyed by operator ID
+_OPERATORS_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "operators.json")
+
+
+# Number of recent detect_operator results (and partial name matches) kept per manager
+_DETECT_CACHE_SIZE = 1024
+
+# Valid MCC (3 digits) and MNC (2-3 digits) values
+_MCC_RE = re.compile(r"\A[0-9]{3}\Z")
+_MNC_RE = re.compile(r"\A[0-9]{2,3}\Z")
+
+# "{name}" placeholders in USSD code templates
+_PLACEHOLDER_RE = re.compile(r"\{(\w+)\}")
+
+
+class _Placeholders(dict):
+    """Template values that leave placeholders without a value as they are."""
+    
+    def __missing__(self, key: str) -> str:
+        return f"{{{key}}}"
+
+
+def _trace_operation(logger, message: str, *args):
+    """
+    log_operation for cheap lookups, entered only when DEBUG logging is enabled.
+    
+    Args:
+        logger: Logger instance to use
+        message: Operation name, a %-format string
+        *args: Arguments for the operation name, formatted only when traced
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        return log_operation(logger, message, *args)
+    return nullcontext()
+
+
+def _intern_strings(value: Any) -> Any:
+    """
+    Intern every string in parsed JSON data.
+    
+    Operator profiles repeat many short strings ("internet", "", "#21#",
+    prefixes); interned, they are stored once and hash and compare by identity.
+    
+    Args:
+        value: Parsed JSON value
+        
+    Returns:
+        The same structure with interned strings
+    """
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, list):
+        return [_intern_strings(item) for item in value]
+    if isinstance(value, dict):
+        return {sys.intern(key): _intern_strings(item) for key, item in value.items()}
+    return value
+
+
+@functools.lru_cache(maxsize=None)
+def _load_operator_specs() -> Dict[str, Dict[str, Any]]:
+    """
+    Read the built-in operator profiles, once per process.
+    
+    Returns:
+        Mapping of operator ID to OperatorProfile fields
+    """
+    with open(_OPERATORS_FILE, encoding="utf-8") as operators_file:
+        return _intern_strings(json.load(operators_file))
+
+
 class OperatorManager:
     """
     Manages mobile operator profiles and configurations.
@@ -37,6 +115,29 @@ class OperatorManager:
         # Operator profiles database
         self.operators: Dict[str, OperatorProfile] = {}
         
+        # Lookup indexes derived from self.operators (see _rebuild_indexes)
+        self._imsi_index: Dict[str, OperatorProfile] = {}
+        self._imsi_prefix_lengths: Tuple[int, ...] = ()
+        self._iccid_index: Dict[str, OperatorProfile] = {}
+        self._iccid_prefix_lengths: Tuple[int, ...] = ()
+        self._name_index: Dict[str, OperatorProfile] = {}
+        self._name_index_items: Tuple[Tuple[str, OperatorProfile], ...] = ()
+        self._by_country: Dict[str, List[OperatorProfile]] = {}
+        # (lowercase operator name, service) -> (USSD template, its placeholders)
+        self._ussd_templates: Dict[Tuple[str, str], Tuple[str, frozenset]] = {}
+        
+        # Names resolved by partial match, lowercased, and the profile they matched
+        self._partial_names: Dict[str, OperatorProfile] = {}
+        
+        # Recent detect_operator matches, keyed by the prefixes the result depends on
+        self._detect_cache: Dict[Tuple[str, str], Optional[Tuple[OperatorProfile, str, str]]] = {}
+        
+        # Statistics derived from self.operators, maintained on every change
+        self._countries: Counter = Counter()
+        self._mccs: Counter = Counter()
+        self._ussd_count = 0
+        self._apn_count = 0
+        
         # Initialize operator database
         self._initialize_operator_database()
         
@@ -47,152 +148,96 @@ class OperatorManager:
         """Initialize the operator profiles database."""
         with log_operation(self.logger, "Initialize operator database"):
             try:
-                # Algerian operators
-                self.operators["ooredoo_algeria"] = OperatorProfile(
-                name="Ooredoo Algeria",
-                country="Algeria",
-                mcc="603",
-                    mnc=["01"],
-                    imsi_prefix=["60301"],
-                    iccid_prefix=["8921301"],
-                balance_ussd="*223#",
-                data_balance_ussd="*223*2#",
-                recharge_ussd="*100*{code}#",
-                apn_settings={
-                        "name": "internet",
-                    "apn": "internet",
-                    "username": "",
-                    "password": "",
-                        "auth_type": "none"
-                },
-                common_services={
-                        "balance": "*200#",
-                    "data_balance": "*223*2#",
-                    "recharge": "*100*{code}#",
-                        "call_forward": "*21*{number}#",
-                        "call_forward_cancel": "#21#",
-                        "missed_calls": "*100#",
-                        "last_recharge": "*100*1#"
-                    }
-                )
-                
-                self.operators["djezzy_algeria"] = OperatorProfile(
-                    name="Djezzy Algeria",
-                country="Algeria",
-                mcc="603",
-                    mnc=["03"],
-                    imsi_prefix=["60303"],
-                    iccid_prefix=["8921303"],
-                balance_ussd="*100#",
-                    data_balance_ussd="*100*2#",
-                recharge_ussd="*100*{code}#",
-                apn_settings={
-                        "name": "internet",
-                        "apn": "internet",
-                    "username": "",
-                    "password": "",
-                        "auth_type": "none"
-                },
-                common_services={
-                        "balance": "*710#",
-                        "data_balance": "*100*2#",
-                    "recharge": "*100*{code}#",
-                        "call_forward": "*21*{number}#",
-                        "call_forward_cancel": "#21#",
-                        "missed_calls": "*100*1#",
-                        "last_recharge": "*100*3#"
-                    }
-                )
-                
-                self.operators["mobilis_algeria"] = OperatorProfile(
-                    name="Mobilis Algeria",
-                country="Algeria",
-                mcc="603",
-                    mnc=["02"],
-                    imsi_prefix=["60302"],
-                    iccid_prefix=["8921302"],
-                    balance_ussd="*101#",
-                    data_balance_ussd="*101*2#",
-                    recharge_ussd="*101*{code}#",
-                    apn_settings={
-                        "name": "internet",
-                        "apn": "internet",
-                        "username": "",
-                        "password": "",
-                        "auth_type": "none"
-                    },
-                    common_services={
-                        "balance": "*222#",
-                        "data_balance": "*101*2#",
-                        "recharge": "*101*{code}#",
-                        "call_forward": "*21*{number}#",
-                        "call_forward_cancel": "#21#",
-                        "missed_calls": "*101*1#",
-                        "last_recharge": "*101*3#"
-                    }
-                )
-                
-                # International operators (examples)
-                self.operators["orange_france"] = OperatorProfile(
-                    name="Orange France",
-                    country="France",
-                    mcc="208",
-                    mnc=["01", "02", "03", "04", "05", "06", "07", "08", "09", "10"],
-                    imsi_prefix=["20801", "20802", "20803", "20804", "20805", "20806", "20807", "20808", "20809", "20810"],
-                    iccid_prefix=["20801", "20802", "20803", "20804", "20805", "20806", "20807", "20808", "20809", "20810"],
-                    balance_ussd="*100#",
-                    data_balance_ussd="*100*2#",
-                    recharge_ussd="*100*{code}#",
-                    apn_settings={
-                        "name": "orange",
-                        "apn": "orange",
-                        "username": "",
-                        "password": "",
-                        "auth_type": "none"
-                    },
-                    common_services={
-                        "balance": "*100#",
-                        "data_balance": "*100*2#",
-                        "recharge": "*100*{code}#"
-                    }
-                )
-                
-                self.operators["vodafone_uk"] = OperatorProfile(
-                    name="Vodafone UK",
-                    country="United Kingdom",
-                    mcc="234",
-                    mnc=["15", "91", "92", "93", "94", "95", "96", "97", "98", "99"],
-                    imsi_prefix=["23415", "23491", "23492", "23493", "23494", "23495", "23496", "23497", "23498", "23499"],
-                    iccid_prefix=["23415", "23491", "23492", "23493", "23494", "23495", "23496", "23497", "23498", "23499"],
-                balance_ussd="*100#",
-                data_balance_ussd="*100*2#",
-                    recharge_ussd="*100*{code}#",
-                apn_settings={
-                        "name": "internet",
-                    "apn": "internet",
-                    "username": "",
-                    "password": "",
-                        "auth_type": "none"
-                },
-                common_services={
-                        "balance": "*100#",
-                    "data_balance": "*100*2#",
-                        "recharge": "*100*{code}#"
-                    }
-                )
-                
+                # Build every profile first, so a bad entry leaves self.operators untouched
+                profiles = {
+                    operator_id: OperatorProfile(**spec)
+                    for operator_id, spec in _load_operator_specs().items()
+                }
+                self.operators.update(profiles)
+                for profile in profiles.values():
+                    self._count_profile(profile, 1)
+                self._rebuild_indexes()
                 self.logger.info(f"Successfully loaded {len(self.operators)} operator profiles")
                 
                 # Log performance metrics
                 log_performance(self.logger, "operator_database_init", 
                     total_operators=len(self.operators),
-                    countries=len(set(op.country for op in self.operators.values()))
+                    countries=len(self._countries)
                 )
                 
             except Exception as e:
                 self.logger.error(f"Failed to initialize operator database: {e}")
                 raise ConfigurationException(f"Failed to initialize operator database: {e}")
     
+    def _rebuild_indexes(self):
+        """Rebuild the lookup indexes after self.operators changed."""
+        imsi_index = {}
+        iccid_index = {}
+        name_index = {}
+        by_country = {}
+        for profile in self.operators.values():
+            name_index.setdefault(profile.name.lower(), profile)
+            by_country.setdefault(profile.country.lower(), []).append(profile)
+            for prefix in profile.imsi_prefix:
+                # Earlier operators win on duplicate prefixes, as in a linear scan
+                imsi_index.setdefault(prefix, profile)
+            for prefix in profile.iccid_prefix:
+                iccid_index.setdefault(prefix, profile)
+        
+        self._detect_cache.clear()
+        self._partial_names.clear()
+        self._imsi_index = imsi_index
+        # Longest first, so the first hit is the longest matching IMSI prefix
+        self._imsi_prefix_lengths = tuple(sorted({len(prefix) for prefix in imsi_index}, reverse=True))
+        self._iccid_index = iccid_index
+        self._iccid_prefix_lengths = tuple(sorted({len(prefix) for prefix in iccid_index}, reverse=True))
+        self._name_index = name_index
+        self._name_index_items = tuple(name_index.items())
+        self._ussd_templates = {
+            (name, service): (template, frozenset(_PLACEHOLDER_RE.findall(template)))
+            for name, profile in name_index.items()
+            for service, template in (profile.common_services or {}).items()
+        }
+        self._by_country = by_country
+    
+    def _count_profile(self, profile: OperatorProfile, delta: int):
+        """
+        Add a profile to, or remove it from, the statistics counters.
+        
+        Args:
+            profile: Operator profile
+            delta: 1 when the profile is added, -1 when it is removed
+        """
+        for counter, key in ((self._countries, profile.country), (self._mccs, profile.mcc)):
+            counter[key] += delta
+            if counter[key] <= 0:
+                del counter[key]
+        if profile.balance_ussd:
+            self._ussd_count += delta
+        if profile.apn_settings:
+            self._apn_count += delta
+    
+    def _store_profile(self, operator_id: str, profile: Optional[OperatorProfile]):
+        """
+        Store or remove a profile, keeping the derived state in sync.
+        
+        Args:
+            operator_id: Unique identifier for the operator
+            profile: New profile, or None to remove the operator
+        """
+        old_profile = self.operators.get(operator_id)
+        if old_profile is not None:
+            self._count_profile(old_profile, -1)
+        
+        if profile is None:
+            del self.operators[operator_id]
+        else:
+            # Assigning in place keeps the operator's position for name lookups
+            self.operators[operator_id] = profile
+            self._count_profile(profile, 1)
+        
+        self._rebuild_indexes()
+    
     def detect_operator(self, imsi: str, iccid: str = None) -> Optional[OperatorProfile]:
         """
         Detect operator based on IMSI and ICCID.
@@ -207,53 +252,82 @@ class OperatorManager:
         Raises:
             OperatorDetectionException: If detection fails
         """
-        with log_operation(self.logger, f"Detect operator for IMSI: {imsi[:6]}..."):
+        with log_operation(self.logger, "Detect operator for IMSI: %s...", imsi[:6]):
             try:
                 if not imsi or len(imsi) < 6:
                     raise OperatorDetectionException("Invalid IMSI provided")
                 
-                # Extract MCC and MNC from IMSI (first 6 digits)
-                mcc_mnc = imsi[:6]
-                
-                # Search for matching operator
-                for operator_id, profile in self.operators.items():
-                    # Check IMSI prefix
-                    if mcc_mnc in profile.imsi_prefix:
-                        self.logger.info(f"Detected operator: {profile.name} (IMSI prefix: {mcc_mnc})")
-                        
-                        # Log performance metrics
+                match = self._match_operator(imsi, iccid)
+                if match is not None:
+                    profile, method, prefix = match
+                    by_imsi = method == "imsi_prefix"
+                    self.logger.info("Detected operator: %s (%s: %s)", profile.name,
+                                     "IMSI prefix" if by_imsi else "ICCID prefix", prefix)
+                    
+                    # Log performance metrics
+                    if self.logger.isEnabledFor(logging.DEBUG):
                         log_performance(self.logger, "operator_detection", 
                             operator=profile.name,
                             country=profile.country,
-                            mcc_mnc=mcc_mnc,
-                            method="imsi_prefix"
+                            method=method,
+                            **{"mcc_mnc" if by_imsi else "iccid_prefix": prefix}
                         )
-                        
-                        return profile
                     
-                    # Check ICCID prefix if provided
-                    if iccid and profile.iccid_prefix:
-                        for iccid_prefix in profile.iccid_prefix:
-                            if iccid.startswith(iccid_prefix):
-                                self.logger.info(f"Detected operator: {profile.name} (ICCID prefix: {iccid_prefix})")
-                                
-                                # Log performance metrics
-                                log_performance(self.logger, "operator_detection", 
-                                    operator=profile.name,
-                                    country=profile.country,
-                                    iccid_prefix=iccid_prefix,
-                                    method="iccid_prefix"
-                                )
-                                
-                                return profile
-                
-                self.logger.warning(f"No operator found for IMSI: {imsi[:6]}...")
+                    return profile
+                
+                self.logger.warning("No operator found for IMSI: %s...", imsi[:6])
                 return None
                 
             except Exception as e:
                 self.logger.error(f"Operator detection failed: {e}")
                 raise OperatorDetectionException(f"Failed to detect operator: {e}")
     
+    def _match_operator(self, imsi: str, iccid: Optional[str]) -> Optional[Tuple[OperatorProfile, str, str]]:
+        """
+        Find the operator of a SIM, remembering recent answers.
+        
+        Args:
+            imsi: International Mobile Subscriber Identity
+            iccid: Integrated Circuit Card Identifier, if known
+            
+        Returns:
+            (profile, method, matched prefix), or None if no operator matches
+        """
+        # The answer only depends on the longest prefixes any operator uses
+        imsi_key = imsi[:self._imsi_prefix_lengths[0]] if self._imsi_prefix_lengths else ""
+        iccid_key = iccid[:self._iccid_prefix_lengths[0]] if iccid and self._iccid_prefix_lengths else ""
+        key = (imsi_key, iccid_key)
+        
+        cache = self._detect_cache
+        if key in cache:
+            # Move to the end: the oldest entries are evicted first
+            match = cache[key] = cache.pop(key)
+            return match
+        
+        match = None
+        
+        # Longest matching prefix (MCC + 2 or 3 digit MNC, or longer)
+        for length in self._imsi_prefix_lengths:
+            mcc_mnc = imsi[:length]
+            profile = self._imsi_index.get(mcc_mnc)
+            if profile is not None:
+                match = (profile, "imsi_prefix", mcc_mnc)
+                break
+        
+        # Fall back to the longest matching ICCID prefix if provided
+        if match is None and iccid:
+            for length in self._iccid_prefix_lengths:
+                iccid_prefix = iccid[:length]
+                profile = self._iccid_index.get(iccid_prefix)
+                if profile is not None:
+                    match = (profile, "iccid_prefix", iccid_prefix)
+                    break
+        
+        if len(cache) >= _DETECT_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[key] = match
+        return match
+    
     def get_operator_by_name(self, operator_name: str) -> Optional[OperatorProfile]:
         """
         Get operator profile by name.
@@ -264,17 +338,22 @@ class OperatorManager:
         Returns:
             OperatorProfile if found, None otherwise
         """
-        with log_operation(self.logger, f"Get operator by name: {operator_name}"):
+        with _trace_operation(self.logger, "Get operator by name: %s", operator_name):
             try:
-                # Search for exact match
-                for operator_id, profile in self.operators.items():
-                    if profile.name.lower() == operator_name.lower():
-                        return profile
+                name = operator_name.lower()
+                
+                # Search for exact match, then for a partial match seen before
+                profile = self._name_index.get(name) or self._partial_names.get(name)
+                if profile is not None:
+                    return profile
                 
                 # Search for partial match
-                for operator_id, profile in self.operators.items():
-                    if operator_name.lower() in profile.name.lower():
-                        self.logger.info(f"Found partial match: {profile.name}")
+                for profile_name, profile in self._name_index_items:
+                    if name in profile_name:
+                        self.logger.info("Found partial match: %s", profile.name)
+                        if len(self._partial_names) >= _DETECT_CACHE_SIZE:
+                            del self._partial_names[next(iter(self._partial_names))]
+                        self._partial_names[name] = profile
                         return profile
                 
                 self.logger.warning(f"No operator found with name: {operator_name}")
@@ -295,13 +374,11 @@ class OperatorManager:
         Returns:
             OperatorProfile if found, None otherwise
         """
-        with log_operation(self.logger, f"Get operator by MCC/MNC: {mcc}/{mnc}"):
+        with _trace_operation(self.logger, "Get operator by MCC/MNC: %s/%s", mcc, mnc):
             try:
-                mcc_mnc = f"{mcc}{mnc}"
-                
-                for operator_id, profile in self.operators.items():
-                    if mcc_mnc in profile.imsi_prefix:
-                        return profile
+                profile = self._imsi_index.get(f"{mcc}{mnc}")
+                if profile is not None:
+                    return profile
                 
                 self.logger.warning(f"No operator found for MCC/MNC: {mcc}/{mnc}")
                 return None
@@ -320,15 +397,11 @@ class OperatorManager:
         Returns:
             List of OperatorProfile objects
         """
-        with log_operation(self.logger, f"Get operators by country: {country}"):
+        with _trace_operation(self.logger, "Get operators by country: %s", country):
             try:
-                operators = []
-                
-                for operator_id, profile in self.operators.items():
-                    if profile.country.lower() == country.lower():
-                        operators.append(profile)
+                operators = list(self._by_country.get(country.lower(), ()))
                 
-                self.logger.info(f"Found {len(operators)} operators for {country}")
+                self.logger.info("Found %d operators for %s", len(operators), country)
                 return operators
                 
             except Exception as e:
@@ -342,10 +415,10 @@ class OperatorManager:
         Returns:
             List of all OperatorProfile objects
         """
-        with log_operation(self.logger, "Get all supported operators"):
+        with _trace_operation(self.logger, "Get all supported operators"):
             try:
                 operators = list(self.operators.values())
-                self.logger.info(f"Returning {len(operators)} supported operators")
+                self.logger.info("Returning %d supported operators", len(operators))
                 return operators
                 
             except Exception as e:
@@ -367,7 +440,7 @@ class OperatorManager:
         Raises:
             UnsupportedOperatorException: If operator not supported
         """
-        with log_operation(self.logger, f"Get USSD code for {operator_name} - {service}"):
+        with _trace_operation(self.logger, "Get USSD code for %s - %s", operator_name, service):
             try:
                 # Get operator profile
                 operator = self.get_operator_by_name(operator_name)
@@ -375,16 +448,15 @@ class OperatorManager:
                     raise UnsupportedOperatorException(f"Operator not supported: {operator_name}")
                 
                 # Get USSD code from common services
-                if operator.common_services and service in operator.common_services:
-                    ussd_code = operator.common_services[service]
+                entry = self._ussd_templates.get((operator.name.lower(), service))
+                if entry is not None:
+                    ussd_code, placeholders = entry
                     
                     # Replace placeholders with provided values
-                    for key, value in kwargs.items():
-                        placeholder = f"{{{key}}}"
-                        if placeholder in ussd_code:
-                            ussd_code = ussd_code.replace(placeholder, str(value))
+                    if placeholders:
+                        ussd_code = ussd_code.format_map(_Placeholders(kwargs))
                     
-                    self.logger.info(f"USSD code for {operator_name} - {service}: {ussd_code}")
+                    self.logger.info("USSD code for %s - %s: %s", operator_name, service, ussd_code)
                     return ussd_code
                 
                 # Check specific USSD fields
@@ -407,7 +479,7 @@ class OperatorManager:
                 self.logger.error(f"Failed to get USSD code: {e}")
                 return None
     
-    def get_apn_settings(self, operator_name: str) -> Optional[Dict[str, Any]]:
+    def get_apn_settings(self, operator_name: str) -> Optional[Mapping[str, Any]]:
         """
         Get APN settings for a specific operator.
         
@@ -415,9 +487,9 @@ class OperatorManager:
             operator_name: Name of the operator
             
         Returns:
-            APN settings dictionary if found, None otherwise
+            Read-only APN settings mapping if found, None otherwise
         """
-        with log_operation(self.logger, f"Get APN settings for {operator_name}"):
+        with _trace_operation(self.logger, "Get APN settings for %s", operator_name):
             try:
                 operator = self.get_operator_by_name(operator_name)
                 if operator and operator.apn_settings:
@@ -441,21 +513,22 @@ class OperatorManager:
         Returns:
             True if added successfully, False otherwise
         """
-        with log_operation(self.logger, f"Add operator: {operator_id}"):
+        with log_operation(self.logger, "Add operator: %s", operator_id):
             try:
                 if operator_id in self.operators:
-                    self.logger.warning(f"Operator {operator_id} already exists, updating...")
+                    self.logger.warning("Operator %s already exists, updating...", operator_id)
                 
-                self.operators[operator_id] = profile
-                self.logger.info(f"Successfully added operator: {profile.name}")
+                self._store_profile(operator_id, profile)
+                self.logger.info("Successfully added operator: %s", profile.name)
                 
                 # Log performance metrics
-                log_performance(self.logger, "operator_added", 
-                    operator_id=operator_id,
-                    operator_name=profile.name,
-                    country=profile.country,
-                    total_operators=len(self.operators)
-                )
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    log_performance(self.logger, "operator_added", 
+                        operator_id=operator_id,
+                        operator_name=profile.name,
+                        country=profile.country,
+                        total_operators=len(self.operators)
+                    )
                 
                 return True
                 
@@ -480,7 +553,7 @@ class OperatorManager:
                     return False
                 
                 operator_name = self.operators[operator_id].name
-                del self.operators[operator_id]
+                self._store_profile(operator_id, None)
                 
                 self.logger.info(f"Successfully removed operator: {operator_name}")
                 return True
@@ -506,8 +579,12 @@ class OperatorManager:
                     self.logger.warning(f"Operator {operator_id} not found, cannot update")
                     return False
                 
-                old_name = self.operators[operator_id].name
-                self.operators[operator_id] = profile
+                old_profile = self.operators[operator_id]
+                old_name = old_profile.name
+                
+                # Profiles are immutable, so the same object means nothing changed
+                if profile is not old_profile:
+                    self._store_profile(operator_id, profile)
                 
                 self.logger.info(f"Successfully updated operator: {old_name} -> {profile.name}")
                 return True
@@ -523,22 +600,19 @@ class OperatorManager:
         Returns:
             Dictionary with statistics
         """
-        with log_operation(self.logger, "Get operator statistics"):
+        with _trace_operation(self.logger, "Get operator statistics"):
             try:
-                countries = set(op.country for op in self.operators.values())
-                mccs = set(op.mcc for op in self.operators.values())
-                
                 stats = {
                     "total_operators": len(self.operators),
-                    "countries": len(countries),
-                    "mccs": len(mccs),
-                    "countries_list": list(countries),
-                    "mccs_list": list(mccs),
-                    "operators_with_ussd": len([op for op in self.operators.values() if op.balance_ussd]),
-                    "operators_with_apn": len([op for op in self.operators.values() if op.apn_settings])
+                    "countries": len(self._countries),
+                    "mccs": len(self._mccs),
+                    "countries_list": list(self._countries),
+                    "mccs_list": list(self._mccs),
+                    "operators_with_ussd": self._ussd_count,
+                    "operators_with_apn": self._apn_count
                 }
                 
-                self.logger.info(f"Operator statistics: {stats}")
+                self.logger.info("Operator statistics: %s", stats)
                 return stats
                 
             except Exception as e:
@@ -568,21 +642,20 @@ class OperatorManager:
                     return False
                 
                 # Validate MCC format (3 digits)
-                if not profile.mcc.isdigit() or len(profile.mcc) != 3:
+                mcc = profile.mcc
+                if not _MCC_RE.match(mcc):
                     self.logger.error("Invalid MCC format")
                     return False
                 
                 # Validate MNC format (2-3 digits)
-                for mnc in profile.mnc:
-                    if not mnc.isdigit() or len(mnc) < 2 or len(mnc) > 3:
-                        self.logger.error("Invalid MNC format")
-                        return False
+                if not all(_MNC_RE.match(mnc) for mnc in profile.mnc):
+                    self.logger.error("Invalid MNC format")
+                    return False
                 
                 # Validate IMSI prefixes
-                for prefix in profile.imsi_prefix:
-                    if not prefix.startswith(profile.mcc):
-                        self.logger.error("IMSI prefix must start with MCC")
-                        return False
+                if not all(prefix[:3] == mcc for prefix in profile.imsi_prefix):
+                    self.logger.error("IMSI prefix must start with MCC")
+                    return False
                 
                 self.logger.info(f"Operator profile validation successful: {profile.name}")
                 return True
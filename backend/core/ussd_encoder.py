@@ -6,7 +6,21 @@ using GSM 7-bit encoding, which is required for proper USSD communication.
 """
 
 import re
-from typing import List, Tuple
+
+
+# Anything but the characters USSD commands typically contain: 0-9, *, #, + and letters
+_USSD_SANITIZE_RE = re.compile(r'[^0-9*#+A-Za-z]')
+
+
+class _TranslationTable(dict):
+    """str.translate table that maps characters it does not list to a default."""
+    
+    def __init__(self, mapping, default):
+        super().__init__(mapping)
+        self.default = default
+    
+    def __missing__(self, key):
+        return self.default
 
 
 class UssdEncoderDecoder:
@@ -37,8 +51,21 @@ class UssdEncoderDecoder:
         'ñ': 0x7D, 'ü': 0x7E, 'à': 0x7F
     }
     
-    # Reverse mapping for decoding
-    GSM_7BIT_CHARS_REVERSE = {v: k for k, v in GSM_7BIT_CHARS.items()}
+    # Reverse mapping for decoding, indexed by code (None for unused codes)
+    GSM_7BIT_CHARS_REVERSE = tuple(map({v: k for k, v in GSM_7BIT_CHARS.items()}.get, range(0x80)))
+    
+    # Characters of the GSM alphabet
+    _GSM_SET = frozenset(GSM_7BIT_CHARS)
+    
+    # Byte value -> GSM character, for bytes decoded as Latin-1; other
+    # bytes keep their Latin-1 character
+    _DECODE_TABLE = {v: k for k, v in GSM_7BIT_CHARS.items() if ord(k) != v}
+    
+    # GSM characters map to themselves, unsupported characters -> space
+    _ENCODE_TABLE = _TranslationTable({ord(k): k for k in GSM_7BIT_CHARS}, " ")
+    
+    # Character -> two hex digits, unsupported characters -> space (0x20)
+    _HEX_TABLE = _TranslationTable({ord(k): f"{v:02X}" for k, v in GSM_7BIT_CHARS.items()}, "20")
     
     @classmethod
     def encode_as_7bit_gsm(cls, text: str) -> str:
@@ -54,19 +81,9 @@ class UssdEncoderDecoder:
         if not text:
             return ""
         
-        # Convert to uppercase for better compatibility
-        text = text.upper()
-        
-        # Encode each character
-        encoded_chars = []
-        for char in text:
-            if char in cls.GSM_7BIT_CHARS:
-                encoded_chars.append(char)
-            else:
-                # Replace unsupported characters with space
-                encoded_chars.append(' ')
-        
-        return ''.join(encoded_chars)
+        # Convert to uppercase for better compatibility, then replace
+        # unsupported characters with space
+        return text.upper().translate(cls._ENCODE_TABLE)
     
     @classmethod
     def encode_as_hex_7bit_gsm(cls, text: str) -> str:
@@ -82,20 +99,9 @@ class UssdEncoderDecoder:
         if not text:
             return ""
         
-        # Convert to uppercase for better compatibility
-        text = text.upper()
-        
-        # Encode each character to hex
-        hex_chars = []
-        for char in text:
-            if char in cls.GSM_7BIT_CHARS:
-                hex_value = cls.GSM_7BIT_CHARS[char]
-                hex_chars.append(f"{hex_value:02X}")
-            else:
-                # Replace unsupported characters with space
-                hex_chars.append("20")
-        
-        return ''.join(hex_chars)
+        # Convert to uppercase for better compatibility, then encode each
+        # character to hex (unsupported characters become a space)
+        return text.upper().translate(cls._HEX_TABLE)
     
     @classmethod
     def decode_from_7bit_gsm(cls, encoded_text: str) -> str:
@@ -111,16 +117,8 @@ class UssdEncoderDecoder:
         if not encoded_text:
             return ""
         
-        # Decode each character
-        decoded_chars = []
-        for char in encoded_text:
-            if char in cls.GSM_7BIT_CHARS_REVERSE:
-                decoded_chars.append(char)
-            else:
-                # Keep unknown characters as is
-                decoded_chars.append(char)
-        
-        return ''.join(decoded_chars)
+        # GSM characters decode to themselves; unknown characters are kept as is
+        return encoded_text
     
     @classmethod
     def decode_from_hex_7bit_gsm(cls, hex_text: str) -> str:
@@ -136,6 +134,17 @@ class UssdEncoderDecoder:
         if not hex_text:
             return ""
         
+        # Well-formed input: parse all pairs at once and map the bytes in one pass
+        # (a trailing odd digit is ignored; fromhex skipping whitespace shows up
+        # as a shorter result and takes the pairwise path below)
+        even_text = hex_text[:len(hex_text) & ~1]
+        try:
+            raw = bytes.fromhex(even_text)
+        except ValueError:
+            raw = None
+        if raw is not None and len(raw) * 2 == len(even_text):
+            return raw.decode("latin-1").translate(cls._DECODE_TABLE)
+        
         # Convert hex pairs to characters
         decoded_chars = []
         for i in range(0, len(hex_text), 2):
@@ -143,8 +152,9 @@ class UssdEncoderDecoder:
                 hex_pair = hex_text[i:i+2]
                 try:
                     char_code = int(hex_pair, 16)
-                    if char_code in cls.GSM_7BIT_CHARS_REVERSE:
-                        decoded_chars.append(cls.GSM_7BIT_CHARS_REVERSE[char_code])
+                    char = cls.GSM_7BIT_CHARS_REVERSE[char_code] if 0 <= char_code < 0x80 else None
+                    if char is not None:
+                        decoded_chars.append(char)
                     else:
                         # Keep unknown characters as is
                         decoded_chars.append(chr(char_code))
@@ -168,11 +178,7 @@ class UssdEncoderDecoder:
         if not text:
             return True
         
-        for char in text:
-            if char not in cls.GSM_7BIT_CHARS:
-                return False
-        
-        return True
+        return cls._GSM_SET.issuperset(text)
     
     @classmethod
     def sanitize_for_ussd(cls, text: str) -> str:
@@ -189,8 +195,7 @@ class UssdEncoderDecoder:
             return ""
         
         # Remove any non-USSD characters
-        # USSD commands typically contain: 0-9, *, #, +, and some letters
-        sanitized = re.sub(r'[^0-9*#+A-Za-z]', '', text)
+        sanitized = _USSD_SANITIZE_RE.sub('', text)
         
         # Convert to uppercase
         return sanitized.upper()
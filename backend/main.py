@@ -6,13 +6,14 @@ Huawei USB modems, including SMS, USSD, and SIM card operations.
 """
 
 import asyncio
+import json
 import logging
 from contextlib import asynccontextmanager
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Set
 
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, Depends
+from fastapi import FastAPI, HTTPException, WebSocket, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import ValidationError
 
 from backend.core.multi_modem_manager import MultiModemManager
@@ -40,27 +41,32 @@ class ConnectionManager:
     """Manages WebSocket connections for real-time updates."""
     
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Set[WebSocket] = set()
 
     async def connect(self, websocket: WebSocket):
         """Connect a new WebSocket client."""
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
         logger.info(f"WebSocket client connected. Total connections: {len(self.active_connections)}")
 
     def disconnect(self, websocket: WebSocket):
         """Disconnect a WebSocket client."""
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
-            logger.info(f"WebSocket client disconnected. Total connections: {len(self.active_connections)}")
+        self.active_connections.discard(websocket)
+        logger.info(f"WebSocket client disconnected. Total connections: {len(self.active_connections)}")
 
     async def broadcast(self, message: str):
-        """Broadcast message to all connected clients."""
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(message)
-            except Exception as e:
-                logger.error(f"Failed to send message to WebSocket client: {e}")
+        """Broadcast message to all connected clients, concurrently."""
+        # Snapshot: clients may connect or disconnect while the sends are in flight
+        connections = list(self.active_connections)
+        results = await asyncio.gather(
+            *(connection.send_text(message) for connection in connections),
+            return_exceptions=True
+        )
+        
+        # Drop the failed clients once every send has finished
+        for connection, result in zip(connections, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to send message to WebSocket client: {result}")
                 self.disconnect(connection)
 
 
@@ -107,6 +113,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -120,45 +127,54 @@ app.add_middleware(
 )
 
 # Exception handlers
+def _error_response(status_code: int, error: ErrorResponse) -> Response:
+    """
+    Build a JSON error response.
+    
+    The model is serialized by pydantic directly, without going through a
+    dict and json.dumps.
+    
+    Args:
+        status_code: HTTP status code
+        error: Error response body
+        
+    Returns:
+        Response with the serialized error
+    """
+    return Response(content=error.model_dump_json(), status_code=status_code, media_type="application/json")
+
+
 @app.exception_handler(SimManagerException)
 async def sim_manager_exception_handler(request, exc: SimManagerException):
     """Handle SimManager exceptions."""
     status_code = get_http_status_code(exc)
-    return JSONResponse(
-        status_code=status_code,
-        content=ErrorResponse(
-            error=exc.message,
-            error_code=exc.error_code,
-            details=exc.details
-        ).dict()
-    )
+    return _error_response(status_code, ErrorResponse(
+        error=exc.message,
+        error_code=exc.error_code,
+        details=exc.details
+    ))
 
 
 @app.exception_handler(ValidationError)
 async def validation_exception_handler(request, exc: ValidationError):
     """Handle Pydantic validation errors."""
-    return JSONResponse(
-        status_code=422,
-        content=ErrorResponse(
-            error="Validation error",
-            error_code="VALIDATION_ERROR",
-            details={"errors": exc.errors()}
-        ).dict()
-    )
+    return _error_response(422, ErrorResponse(
+        error="Validation error",
+        error_code="VALIDATION_ERROR",
+        # exc.json() renders non-JSON context values (the raised ValueError) as strings
+        details={"errors": json.loads(exc.json())}
+    ))
 
 
 @app.exception_handler(Exception)
 async def general_exception_handler(request, exc: Exception):
     """Handle general exceptions."""
     logger.error(f"Unexpected error: {exc}")
-    return JSONResponse(
-        status_code=500,
-        content=ErrorResponse(
-            error="Internal server error",
-            error_code="INTERNAL_ERROR",
-            details={"exception": str(exc)}
-        ).dict()
-    )
+    return _error_response(500, ErrorResponse(
+        error="Internal server error",
+        error_code="INTERNAL_ERROR",
+        details={"exception": str(exc)}
+    ))
 
 
 # Health and monitoring endpoints
@@ -170,15 +186,15 @@ async def health_check():
     Returns:
         SuccessResponse: System health status
     """
-    with log_operation(logger, "Health Check"):
-        return SuccessResponse(
-            message="System is healthy",
-            data={
-                "status": "healthy",
-                "version": settings.API_VERSION,
-                "connected_modems": len(multi_modem_manager.get_connected_modems())
-            }
-        )
+    # Not wrapped in log_operation: health checks are polled constantly
+    return SuccessResponse(
+        message="System is healthy",
+        data={
+            "status": "healthy",
+            "version": settings.API_VERSION,
+            "connected_modems": multi_modem_manager.connected_modem_count
+        }
+    )
 
 
 @app.get("/api/performance", tags=["System"])
@@ -191,18 +207,18 @@ async def get_performance_metrics():
     """
     with log_operation(logger, "Get Performance Metrics"):
         # Get basic metrics
-        connected_modems = multi_modem_manager.get_connected_modems()
-        total_modems = len(await multi_modem_manager.detect_modems())
+        connected_modems = multi_modem_manager.connected_modem_count
+        total_modems = len(await multi_modem_manager.get_detected_modems())
         
         # Log performance metrics
         log_performance(logger, "api_performance", 
-            connected_modems=len(connected_modems),
+            connected_modems=connected_modems,
             total_modems=total_modems,
             active_websocket_connections=len(manager.active_connections)
         )
         
         return {
-            "connected_modems": len(connected_modems),
+            "connected_modems": connected_modems,
             "total_modems": total_modems,
             "active_websocket_connections": len(manager.active_connections),
             "api_version": settings.API_VERSION
@@ -211,17 +227,20 @@ async def get_performance_metrics():
 
 # Multi-Modem Management Endpoints
 @app.post("/api/modems/detect", response_model=ModemDetectionResponse, tags=["Multi-Modem Management"])
-async def detect_modems():
+async def detect_modems(fast: bool = False):
     """
     Detect all available Huawei modems.
     
     Scans all serial ports and identifies Huawei modems that are responsive to AT commands.
     
+    Args:
+        fast: Stop after the previously detected ports if they all still respond
+        
     Returns:
         ModemDetectionResponse: List of detected modems with their information
     """
     with log_operation(logger, "Modem Detection"):
-        detected_modems = await multi_modem_manager.detect_modems()
+        detected_modems = await multi_modem_manager.detect_modems(fast=fast)
         connected_modems = multi_modem_manager.get_connected_modems()
         
         return ModemDetectionResponse(
@@ -232,6 +251,29 @@ async def detect_modems():
         )
 
 
+@app.post("/api/modems/connect-all", response_model=ModemDetectionResponse, tags=["Multi-Modem Management"])
+async def connect_all_modems():
+    """
+    Detect all available Huawei modems and connect to them.
+    
+    Connections to the detected modems are opened concurrently, up to the
+    maximum number of concurrent modems.
+    
+    Returns:
+        ModemDetectionResponse: Detected modems and the modems now connected
+    """
+    with log_operation(logger, "Connect All Modems"):
+        detected_modems, _ = await multi_modem_manager.detect_and_connect_all()
+        connected_modems = multi_modem_manager.get_connected_modems()
+        
+        return ModemDetectionResponse(
+            detected_modems=detected_modems,
+            connected_modems=connected_modems,
+            total_detected=len(detected_modems),
+            total_connected=len(connected_modems)
+        )
+
+
 @app.post("/api/modems/connect", response_model=SuccessResponse, tags=["Multi-Modem Management"])
 async def connect_modem(request: ModemConnectionRequest):
     """
@@ -254,7 +296,7 @@ async def connect_modem(request: ModemConnectionRequest):
                 data={
                     "modem_id": request.modem_id,
                     "port": modem_info.port if modem_info else None,
-                    "connected_modems": len(multi_modem_manager.get_connected_modems())
+                    "connected_modems": multi_modem_manager.connected_modem_count
                 }
             )
         else:
@@ -281,7 +323,7 @@ async def disconnect_modem(request: ModemDisconnectionRequest):
                 message=f"Successfully disconnected from modem {request.modem_id}",
                 data={
                     "modem_id": request.modem_id,
-                    "connected_modems": len(multi_modem_manager.get_connected_modems())
+                    "connected_modems": multi_modem_manager.connected_modem_count
                 }
             )
         else:
@@ -433,6 +475,22 @@ async def get_modem_balance(modem_id: str):
 
 
 # Legacy Endpoints (Backward Compatibility)
+def _first_connected_modem() -> str:
+    """
+    Get the modem the legacy endpoints operate on.
+    
+    Returns:
+        ID of the first connected modem
+        
+    Raises:
+        ModemNotConnectedException: If no modem is connected
+    """
+    first_modem_id = multi_modem_manager.get_first_connected_modem()
+    if first_modem_id is None:
+        raise ModemNotConnectedException("No modems connected")
+    return first_modem_id
+
+
 @app.get("/api/status", response_model=ModemStatus, tags=["Legacy"])
 async def get_status():
     """
@@ -442,11 +500,7 @@ async def get_status():
         ModemStatus: Status of the first connected modem
     """
     with log_operation(logger, "Get Status (Legacy)"):
-        connected_modems = multi_modem_manager.get_connected_modems()
-        if not connected_modems:
-            raise ModemNotConnectedException("No modems connected")
-        
-        first_modem_id = connected_modems[0]
+        first_modem_id = _first_connected_modem()
         return await multi_modem_manager.get_modem_status(first_modem_id)
 
 
@@ -459,11 +513,7 @@ async def get_sim_info():
         SimInfo: SIM information of the first connected modem
     """
     with log_operation(logger, "Get SIM Info (Legacy)"):
-        connected_modems = multi_modem_manager.get_connected_modems()
-        if not connected_modems:
-            raise ModemNotConnectedException("No modems connected")
-        
-        first_modem_id = connected_modems[0]
+        first_modem_id = _first_connected_modem()
         return await multi_modem_manager.get_modem_sim_info(first_modem_id)
 
 
@@ -476,11 +526,7 @@ async def get_sms():
         List[SmsMessage]: SMS messages from the first connected modem
     """
     with log_operation(logger, "Get SMS (Legacy)"):
-        connected_modems = multi_modem_manager.get_connected_modems()
-        if not connected_modems:
-            raise ModemNotConnectedException("No modems connected")
-        
-        first_modem_id = connected_modems[0]
+        first_modem_id = _first_connected_modem()
         return await multi_modem_manager.get_modem_sms(first_modem_id)
 
 
@@ -496,11 +542,7 @@ async def send_sms(request: SmsRequest):
         SuccessResponse: SMS sending status
     """
     with log_operation(logger, f"Send SMS (Legacy) to {request.number}"):
-        connected_modems = multi_modem_manager.get_connected_modems()
-        if not connected_modems:
-            raise ModemNotConnectedException("No modems connected")
-        
-        first_modem_id = connected_modems[0]
+        first_modem_id = _first_connected_modem()
         success = await multi_modem_manager.send_modem_sms(first_modem_id, request.number, request.message)
         if success:
             return SuccessResponse(
@@ -527,11 +569,7 @@ async def delete_sms(message_id: int):
         SuccessResponse: Deletion status
     """
     with log_operation(logger, f"Delete SMS (Legacy) {message_id}"):
-        connected_modems = multi_modem_manager.get_connected_modems()
-        if not connected_modems:
-            raise ModemNotConnectedException("No modems connected")
-        
-        first_modem_id = connected_modems[0]
+        first_modem_id = _first_connected_modem()
         await multi_modem_manager.delete_modem_sms(first_modem_id, message_id)
         return SuccessResponse(
             message=f"SMS {message_id} deleted successfully from modem {first_modem_id}",
@@ -554,11 +592,7 @@ async def send_ussd(request: UssdRequest):
         UssdResponse: USSD command response
     """
     with log_operation(logger, f"Send USSD (Legacy) {request.command}"):
-        connected_modems = multi_modem_manager.get_connected_modems()
-        if not connected_modems:
-            raise ModemNotConnectedException("No modems connected")
-        
-        first_modem_id = connected_modems[0]
+        first_modem_id = _first_connected_modem()
         return await multi_modem_manager.send_modem_ussd(first_modem_id, request.command)
 
 
@@ -571,11 +605,7 @@ async def get_balance():
         UssdResponse: Balance information
     """
     with log_operation(logger, "Get Balance (Legacy)"):
-        connected_modems = multi_modem_manager.get_connected_modems()
-        if not connected_modems:
-            raise ModemNotConnectedException("No modems connected")
-        
-        first_modem_id = connected_modems[0]
+        first_modem_id = _first_connected_modem()
         return await multi_modem_manager.get_modem_balance(first_modem_id)
 
 
@@ -589,10 +619,10 @@ async def websocket_endpoint(websocket: WebSocket):
     """
     await manager.connect(websocket)
     try:
-        while True:
-            # Keep connection alive
-            await websocket.receive_text()
-    except WebSocketDisconnect:
+        # Client messages are not used: wait for the disconnect without decoding them
+        message = await websocket.receive()
+        while message["type"] != "websocket.disconnect":
+            message = await websocket.receive()
         manager.disconnect(websocket)
     except Exception as e:
         logger.error(f"WebSocket error: {e}")
@@ -5,12 +5,18 @@ This module defines all Pydantic models used throughout the system, providing
 type safety, validation, and serialization for API requests and responses.
 """
 
-from pydantic import BaseModel, Field, validator
-from typing import Optional, List, Dict, Any
+import re
+from pydantic import BaseModel, Field, field_serializer, validator
+from typing import Optional, List, Dict, Any, Tuple, Mapping
+from types import MappingProxyType
 from datetime import datetime
 from enum import Enum
 
 
+# Everything but digits, stripped from phone numbers before validation
+_NON_DIGIT_RE = re.compile(r"\D")
+
+
 class NetworkType(str, Enum):
     """Network technology types supported by modems."""
     GSM = "2G"
@@ -149,7 +155,7 @@ class SmsMessage(BaseModel):
     def validate_phone_number(cls, v):
         """Validate phone number format."""
         # Remove any non-digit characters for validation
-        digits = ''.join(filter(str.isdigit, v))
+        digits = _NON_DIGIT_RE.sub('', v)
         if len(digits) < 10 or len(digits) > 15:
             raise ValueError('Phone number must be between 10 and 15 digits')
         return v
@@ -209,17 +215,36 @@ class OperatorProfile(BaseModel):
     name: str = Field(..., description="Operator name")
     country: str = Field(..., description="Country where operator operates")
     mcc: str = Field(..., description="Mobile Country Code")
-    mnc: List[str] = Field(..., description="Mobile Network Codes")
-    imsi_prefix: List[str] = Field(..., description="IMSI prefixes for this operator")
-    iccid_prefix: List[str] = Field(..., description="ICCID prefixes for this operator")
+    mnc: Tuple[str, ...] = Field(..., description="Mobile Network Codes")
+    imsi_prefix: Tuple[str, ...] = Field(..., description="IMSI prefixes for this operator")
+    iccid_prefix: Tuple[str, ...] = Field(..., description="ICCID prefixes for this operator")
     balance_ussd: Optional[str] = Field(None, description="USSD code for balance check")
     data_balance_ussd: Optional[str] = Field(None, description="USSD code for data balance check")
     recharge_ussd: Optional[str] = Field(None, description="USSD code for recharge")
-    apn_settings: Optional[Dict[str, Any]] = Field(None, description="APN configuration")
-    common_services: Optional[Dict[str, str]] = Field(None, description="Common USSD services")
+    apn_settings: Optional[Mapping[str, Any]] = Field(None, description="APN configuration")
+    common_services: Optional[Mapping[str, str]] = Field(None, description="Common USSD services")
+    
+    @validator('apn_settings', 'common_services')
+    def freeze_mapping(cls, v):
+        """Store mappings as read-only views, profiles are shared."""
+        return MappingProxyType(dict(v)) if v is not None else v
+    
+    @field_serializer('apn_settings', 'common_services')
+    def serialize_mapping(self, v):
+        """Serialize the read-only mappings as plain dicts."""
+        return dict(v) if v is not None else v
+    
+    def __hash__(self) -> int:
+        """Hash the field values, with the mappings hashed by their items."""
+        return hash(tuple(
+            frozenset(value.items()) if isinstance(value, Mapping) else value
+            for value in self.__dict__.values()
+        ))
     
     class Config:
         """Pydantic configuration."""
+        # Profiles are shared by the operator manager's lookup indexes
+        frozen = True
         schema_extra = {
             "example": {
                 "name": "Ooredoo Algeria",
@@ -363,7 +388,7 @@ class SmsRequest(BaseModel):
     @validator('number')
     def validate_phone_number(cls, v):
         """Validate phone number format."""
-        digits = ''.join(filter(str.isdigit, v))
+        digits = _NON_DIGIT_RE.sub('', v)
         if len(digits) < 10 or len(digits) > 15:
             raise ValueError('Phone number must be between 10 and 15 digits')
         return v